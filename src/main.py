@@ -112,17 +112,7 @@ def main():
 
     # シミュレーションの実行
     print("シミュレーションを実行中...")
-    all_results = []
-    for idx, assignment in enumerate(assignments, 1):
-        sales_persona = assignment.sales_persona
-        for comp_idx, company_persona in enumerate(assignment.assigned_companies, 1):
-            print(
-                f"\n=== 営業マン{idx} と 企業ペルソナ【担当企業{comp_idx}】 の時系列訪問シミュレーション ==="
-            )
-            result = simulation_service.simulate_time_series_visits(
-                sales_persona, company_persona
-            )
-            all_results.append(result)
+    all_results = simulation_service.simulate_assignments(assignments)
 
     # 結果の保存
     print("結果を保存中...")
@@ -177,10 +167,7 @@ def main():
                     "decision_making_style": persona.decision_making_style,
                     "risk_tolerance": persona.risk_tolerance,
                     "financial_literacy": persona.financial_literacy,
-                    "interest_products": {
-                        product_type.value: score
-                        for product_type, score in persona.interest_products.items()
-                    },
+                    "interest_products": persona.interest_products_by_value,
                     "contact_person": {
                         "name": persona.contact_person.name,
                         "position": persona.contact_person.position,
@@ -1,12 +1,45 @@
+import time
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from src.models.settings import SimulationConfig
 
 
+# nowが直近に返した値（エポック秒, 日時, ISO形式文字列）
+# スレッドから並行して呼ばれるため、1つのタプルとして一度に置き換える
+_last_now: Tuple[float, datetime, str] = (0.0, datetime.fromtimestamp(0), "")
+
+
+def _current() -> Tuple[float, datetime, str]:
+    """現在時刻を（エポック秒, 日時, ISO形式文字列）の組で返す（1ミリ秒未満は前回の組を再利用）"""
+    global _last_now
+    t = time.time()
+    last = _last_now
+    if abs(t - last[0]) < 0.001:
+        return last
+    current = datetime.fromtimestamp(t)
+    last = _last_now = (t, current, current.isoformat())
+    return last
+
+
+def now() -> datetime:
+    """現在時刻を返す（1ミリ秒未満の連続した呼び出しでは同じ値を再利用）"""
+    return _current()[1]
+
+
+def now_iso() -> str:
+    """現在時刻をISO形式で返す（1ミリ秒未満の連続した呼び出しでは同じ値を再利用）"""
+    return _current()[2]
+
+
+def clamp01(value: float) -> float:
+    """値を0.0-1.0の範囲に制限"""
+    return 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+
+
 class EvaluationCriteria(str, Enum):
     """評価基準を表す列挙型"""
 
@@ -39,9 +72,7 @@ class InterestScore(BaseModel):
     factors: Dict[str, Any] = Field(
         default_factory=dict, description="スコアに影響を与えた要因"
     )
-    timestamp: str = Field(
-        default_factory=lambda: datetime.now().isoformat(), description="評価時刻"
-    )
+    timestamp: str = Field(default_factory=now_iso, description="評価時刻")
 
     class Config:
         json_schema_extra = {
@@ -61,7 +92,7 @@ class InterestScore(BaseModel):
     @classmethod
     def model_validate(cls, value, **kwargs):
         if isinstance(value, dict) and "timestamp" not in value:
-            value["timestamp"] = datetime.now().isoformat()
+            value["timestamp"] = now_iso()
         return super().model_validate(value, **kwargs)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -82,7 +113,7 @@ class EvaluationResult(BaseModel):
     scores: Dict[str, float]
     concerns: List[str]
     required_info: Optional[List[str]] = None
-    evaluation_date: datetime = Field(default_factory=datetime.now)
+    evaluation_date: datetime = Field(default_factory=now)
 
     class Config:
         json_encoders = {datetime: lambda v: v.isoformat()}
@@ -99,3 +130,28 @@ class Proposal(BaseModel):
     cost_information: Dict[str, Any]
     support_details: Dict[str, Any]
     track_record: List[Dict[str, Any]]
+
+    # 評価で使う数値項目（構築時に一度だけ変換し、変換できない場合はNone）
+    _total_cost: Optional[float] = PrivateAttr(default=None)
+    _terms_annual_sales: Optional[float] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        total_cost = self.cost_information.get("total_cost")
+        if isinstance(total_cost, (int, float)):
+            self._total_cost = total_cost
+        annual_sales = self.terms.get("annual_sales")
+        if annual_sales is not None:
+            try:
+                self._terms_annual_sales = float(annual_sales)
+            except (ValueError, TypeError):
+                pass
+
+    @property
+    def total_cost_value(self) -> Optional[float]:
+        """総コストの数値（数値でない場合はNone）"""
+        return self._total_cost
+
+    @property
+    def terms_annual_sales_value(self) -> Optional[float]:
+        """条件に含まれる年商の数値（数値に変換できない場合はNone）"""
+        return self._terms_annual_sales
@@ -1,9 +1,46 @@
 import random
+import re
+import time
+from bisect import bisect_right
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, cast
+from functools import cached_property, lru_cache
+from itertools import accumulate
+from math import prod
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    ValidationError,
+    WithJsonSchema,
+    field_serializer,
+    field_validator,
+)
 
-from pydantic import BaseModel, Field, ValidationError
+try:
+    # インストールされていればC実装のISO 8601パーサーを使う
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
 
 from src.models.evaluation import (
     EvaluationCriteria,
@@ -11,6 +48,8 @@ from src.models.evaluation import (
     InterestLevel,
     InterestScore,
     Proposal,
+    clamp01,
+    now_iso,
 )
 from src.models.settings import SimulationConfig
 from src.services.evaluation_service import ProposalEvaluator
@@ -50,6 +89,36 @@ class ProductType(str, Enum):
     OTHER = "other"  # その他
 
 
+# 商品タイプの定義順（interest_productsの並び順）
+_PRODUCT_TYPES: Tuple[ProductType, ...] = tuple(ProductType)
+_PRODUCT_TYPE_VALUES: Tuple[str, ...] = tuple(pt.value for pt in ProductType)
+_PRODUCT_INDEX: Dict[ProductType, int] = {pt: i for i, pt in enumerate(ProductType)}
+# 値から商品タイプへの対応表（Enumの呼び出しより軽量な検索用）
+_PRODUCT_BY_VALUE: Dict[str, ProductType] = {pt.value: pt for pt in ProductType}
+# LLMへ提示するinterest_productsの入力形式（商品タイプをキーとする辞書）
+_INTEREST_PRODUCTS_SCHEMA: Dict[str, Any] = {
+    "title": "Interest Products",
+    "type": "object",
+    "propertyNames": {"enum": list(_PRODUCT_TYPE_VALUES)},
+    "additionalProperties": {"type": "number"},
+}
+
+
+def _default_interest_products() -> List[float]:
+    """商品への興味度の初期値"""
+    return [0.5] * len(_PRODUCT_TYPES)
+
+
+def _interest_products_list(value: Any) -> List[float]:
+    """商品タイプをキーとする辞書を定義順のリストに変換（未指定の商品は初期値）"""
+    if not isinstance(value, dict):
+        return list(value)
+    interest_products = _default_interest_products()
+    for product_type, score in value.items():
+        interest_products[_PRODUCT_INDEX[ProductType(product_type)]] = score
+    return interest_products
+
+
 class ExperienceLevel(str, Enum):
     JUNIOR = "junior"  # 入社1-3年目
     MIDDLE = "middle"  # 入社4-7年目
@@ -69,6 +138,28 @@ class PersonalityTrait(str, Enum):
     PATIENT = "patient"  # 忍耐強い
 
 
+# 営業成功率の計算に使う係数
+_BASE_SUCCESS_RATE = 0.5
+# 経験値による調整
+_EXPERIENCE_MULTIPLIERS: Dict[ExperienceLevel, float] = {
+    ExperienceLevel.JUNIOR: 0.7,
+    ExperienceLevel.MIDDLE: 0.85,
+    ExperienceLevel.SENIOR: 1.0,
+    ExperienceLevel.VETERAN: 1.2,
+}
+# 性格特性による調整
+_TRAIT_MULTIPLIERS: Dict[PersonalityTrait, float] = {
+    PersonalityTrait.AGGRESSIVE: 1.1,
+    PersonalityTrait.CAUTIOUS: 0.9,
+    PersonalityTrait.FRIENDLY: 1.05,
+    PersonalityTrait.PROFESSIONAL: 1.15,
+    PersonalityTrait.INEXPERIENCED: 0.8,
+    PersonalityTrait.KNOWLEDGEABLE: 1.1,
+    PersonalityTrait.IMPATIENT: 0.9,
+    PersonalityTrait.PATIENT: 1.05,
+}
+
+
 class CustomerPersonalityTrait(str, Enum):
     # 企業担当者の性格特性
     AUTHORITATIVE = "authoritative"  # 高圧的
@@ -81,6 +172,48 @@ class CustomerPersonalityTrait(str, Enum):
     ANALYTICAL = "analytical"  # 分析的
 
 
+class NeedKind(str, Enum):
+    # update_situationで注記の対象となる資金ニーズの種別（定義順に優先して判定）
+    EQUIPMENT = "設備投資"
+    WORKING_CAPITAL = "運転資金"
+
+
+# 性格特性ごとの応答スタイルの補正値（フォーマル度, 詳細度, 返信速度, 協力度）
+_RESPONSE_STYLE_DELTAS: Dict[
+    CustomerPersonalityTrait, Tuple[float, float, float, float]
+] = {
+    CustomerPersonalityTrait.AUTHORITATIVE: (0.2, 0.0, 0.0, -0.1),
+    CustomerPersonalityTrait.COOPERATIVE: (0.0, 0.0, 0.1, 0.2),
+    CustomerPersonalityTrait.SKEPTICAL: (0.0, 0.2, -0.1, 0.0),
+    CustomerPersonalityTrait.TRUSTING: (0.0, 0.0, 0.1, 0.2),
+    CustomerPersonalityTrait.DETAIL_ORIENTED: (0.0, 0.3, -0.2, 0.0),
+    CustomerPersonalityTrait.BIG_PICTURE: (0.0, -0.2, 0.1, 0.0),
+    CustomerPersonalityTrait.IMPULSIVE: (0.0, -0.2, 0.3, 0.0),
+    CustomerPersonalityTrait.ANALYTICAL: (0.0, 0.3, -0.2, 0.0),
+}
+
+# 企業担当者の性格特性ごとに1ビットを割り当てたビットマスク
+_CUSTOMER_TRAIT_BITS: Dict[CustomerPersonalityTrait, int] = {
+    trait: 1 << i for i, trait in enumerate(CustomerPersonalityTrait)
+}
+_IMPULSIVE_BIT = _CUSTOMER_TRAIT_BITS[CustomerPersonalityTrait.IMPULSIVE]
+_ANALYTICAL_BIT = _CUSTOMER_TRAIT_BITS[CustomerPersonalityTrait.ANALYTICAL]
+
+
+# update_situationが資金ニーズに付与する注記（例：「（緊急、30日経過）」）
+_NEED_ANNOTATION_RE = re.compile(r"（(?:緊急|計画)、\d+日経過）")
+# 売上規模の文字列（例：「10.5億円」「1,200億円」）から数値部分を取り出す
+_SALES_FIGURE_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+
+
+def _customer_trait_mask(traits: List[CustomerPersonalityTrait]) -> int:
+    """性格特性のリストをビットマスクに変換"""
+    mask = 0
+    for trait in traits:
+        mask |= _CUSTOMER_TRAIT_BITS[trait]
+    return mask
+
+
 class RejectionReason(str, Enum):
     """商品・提案の拒否理由"""
 
@@ -108,59 +241,320 @@ class ResponseType(str, Enum):
     ACCEPTANCE = "acceptance"  # 提案受諾
 
 
+# 拒否理由の候補と、その添字
+_REJECTION_REASONS: Tuple[RejectionReason, ...] = tuple(RejectionReason)
+_REJECTION_INDEX: Dict[RejectionReason, int] = {
+    reason: i for i, reason in enumerate(_REJECTION_REASONS)
+}
+# 性格特性ごとに重視する（重みを1.5倍する）拒否理由の添字
+_REJECTION_TRAIT_BOOSTS: Dict[CustomerPersonalityTrait, Tuple[int, ...]] = {
+    # 分析的な性格は予算やコストの懸念を重視
+    CustomerPersonalityTrait.ANALYTICAL: (
+        _REJECTION_INDEX[RejectionReason.BUDGET_CONSTRAINT],
+        _REJECTION_INDEX[RejectionReason.COST_CONCERN],
+    ),
+    # 懐疑的な性格はリスクや代替案を重視
+    CustomerPersonalityTrait.SKEPTICAL: (
+        _REJECTION_INDEX[RejectionReason.RISK_CONCERN],
+        _REJECTION_INDEX[RejectionReason.ALTERNATIVE_SOLUTION],
+    ),
+}
+
+
+@lru_cache(maxsize=64)
+def _rejection_trait_weights(
+    traits: Tuple[CustomerPersonalityTrait, ...],
+) -> Tuple[float, ...]:
+    """性格特性に基づく拒否理由ごとの重み"""
+    weights = [1.0] * len(_REJECTION_REASONS)
+    for trait in traits:
+        for idx in _REJECTION_TRAIT_BOOSTS.get(trait, ()):
+            weights[idx] *= 1.5
+    return tuple(weights)
+
+
+def _split_financial_needs(
+    financial_needs: str,
+) -> Optional[Tuple[NeedKind, List[str]]]:
+    """資金ニーズを注記の対象となる種別と、その種別で区切った残りの文字列に分解する
+
+    注記は取り除いてから分解する。対象となる種別を含まない場合はNoneを返す。
+    """
+    text = _NEED_ANNOTATION_RE.sub("", financial_needs)
+    for kind in NeedKind:
+        if kind.value in text:
+            return kind, text.split(kind.value)
+    return None
+
+
+def _situation_volatilities(
+    impulsive: bool, analytical: bool
+) -> Tuple[float, float, float]:
+    """性格特性に応じた（売上, 従業員数, 商品への興味度）の変動幅を計算"""
+    sales_volatility = 0.05  # 基本変動幅
+    employee_volatility = 0.02  # 基本変動幅
+    interest_volatility = 0.1  # 基本変動幅
+    if impulsive:
+        sales_volatility *= 1.5
+        employee_volatility *= 1.5
+        interest_volatility *= 1.5
+    if analytical:
+        interest_volatility *= 0.8
+    return sales_volatility, employee_volatility, interest_volatility
+
+
+# 変動幅に関わる性格特性のビットと、そのビットの組み合わせごとの変動幅
+_VOLATILITY_TRAIT_BITS = _IMPULSIVE_BIT | _ANALYTICAL_BIT
+_SITUATION_VOLATILITIES: Dict[int, Tuple[float, float, float]] = {
+    (_IMPULSIVE_BIT if impulsive else 0)
+    | (_ANALYTICAL_BIT if analytical else 0): _situation_volatilities(
+        impulsive, analytical
+    )
+    for impulsive in (False, True)
+    for analytical in (False, True)
+}
+
+
+def _update_company_figures(
+    sales: float,
+    employee_count: int,
+    interest_products: List[float],
+    volatilities: Tuple[float, float, float],
+    draw: Callable[[], float],
+) -> Tuple[float, int, float, float]:
+    """売上・従業員数・商品への興味度を変動させる（興味度はその場で更新）
+
+    乱数はrandom.uniform(-v, v)と同じ式（-v + 2v * draw()）で直接引く。
+
+    Args:
+        volatilities: _SITUATION_VOLATILITIESから引いた変動幅
+        draw: [0, 1)の一様乱数を返す関数（ペルソナごとの乱数生成器のrandom）
+
+    Returns:
+        (新しい売上, 新しい従業員数, 売上の変化率, 従業員数の変化率)
+    """
+    sales_volatility, employee_volatility, interest_volatility = volatilities
+
+    # 売上規模の変化
+    sales_change_rate = -sales_volatility + 2 * sales_volatility * draw()
+    new_sales = sales * (1 + sales_change_rate)
+
+    # 従業員数の変化
+    employee_change_rate = -employee_volatility + 2 * employee_volatility * draw()
+    new_employee_count = int(employee_count * (1 + employee_change_rate))
+
+    # 商品への興味度の変化（変動幅は全商品で共通）
+    change_width = 2 * interest_volatility
+    for i, interest in enumerate(interest_products):
+        change = -interest_volatility + change_width * draw()
+        interest_products[i] = clamp01(interest + change)
+
+    return new_sales, new_employee_count, sales_change_rate, employee_change_rate
+
+
+def _new_persona_rng() -> random.Random:
+    """グローバルの乱数から種を取った、ペルソナごとの乱数生成器を作成"""
+    return random.Random(random.getrandbits(64))
+
+
+# 応答タイプ判定の既定の閾値
+_DEFAULT_RESPONSE_THRESHOLDS: Dict[str, float] = {
+    "acceptance": 80.0,
+    "positive": 60.0,
+    "question": 40.0,
+    "neutral": 20.0,
+}
+# 性格特性による応答タイプ判定の閾値の補正
+_RESPONSE_THRESHOLD_MODIFIERS: Dict[CustomerPersonalityTrait, float] = {
+    CustomerPersonalityTrait.COOPERATIVE: 5.0,
+    CustomerPersonalityTrait.SKEPTICAL: -5.0,
+}
+# 応答タイプ判定の各境界（昇順）以上のスコアに対応する応答タイプ
+_RESPONSE_TYPES_BY_BOUNDARY = (
+    ResponseType.NEUTRAL,
+    ResponseType.QUESTION,
+    ResponseType.POSITIVE,
+    ResponseType.ACCEPTANCE,
+)
+
+
+# 興味度評価プロンプト（企業ごとに不変な前半部分と、呼び出しごとに変わる後半部分）
+_INTEREST_PROMPT_PREFIX = """
+あなたは以下の特性を持つ企業の担当者です：
+
+企業情報：
+- 企業名：{name}
+- 業種：{industry}
+- 事業内容：{business_description}
+- 規模：従業員数{employee_count}名、売上{annual_sales}
+- 資金ニーズ：{financial_needs}
+
+あなたの特性：
+- 役職：{position}
+- 性格：{traits}
+- 意思決定スタイル：{decision_making_style}
+- リスク許容度：{risk_tolerance}
+- 金融リテラシー：{financial_literacy}
+
+以下の営業担当者からのメッセージに対する、あなたの興味度を0から100の数値で評価してください。
+評価の際は以下の要素を考慮してください：
+- メッセージの内容と自社のニーズとの適合性
+- 提案内容の具体性と実現可能性
+- 自社の状況との整合性
+- あなたの性格や意思決定スタイルとの相性
+
+"""
+_INTEREST_PROMPT_TAIL = """商品タイプ：{product_type}
+
+メッセージ内容：
+{message_content}
+
+以下のJSON形式で回答してください：
+{{
+    "interest_score": 数値（0-100）,
+    "reasoning": "スコアの理由の説明",
+    "key_factors": ["考慮した主な要因をリストで"]
+}}
+"""
+
+# メール生成プロンプトに埋め込むペルソナ情報（ペルソナごとに一度だけ組み立てる）
+_SALES_PROFILE_PROMPT = """営業担当者情報：
+- 名前：{name}
+- 経験：{experience_level}
+- 性格：{traits}
+- 得意分野：{specialties}"""
+_COMPANY_PROFILE_PROMPT = """企業情報：
+- 企業名：{name}
+- 業種：{industry}
+- 事業内容：{business_description}
+- 資金ニーズ：{financial_needs}"""
+_CONTACT_PROFILE_PROMPT = """企業担当者情報：
+- 名前：{name}
+- 役職：{position}"""
+
+# 企業情報の変更時に破棄する、CompanyPersonaのプロンプトのキャッシュ（cached_property）
+_PROMPT_CACHE_ATTRS = (
+    "_interest_prompt_prefix",
+    "company_profile_prompt",
+    "contact_profile_prompt",
+)
+
+# 興味レベル判定の既定の境界値（low, moderate, high, very_highの順）
+_DEFAULT_INTEREST_BANDS: Tuple[float, ...] = (20.0, 40.0, 60.0, 80.0)
+# 境界値を超えた数に対応する興味レベル
+_INTEREST_LEVELS_BY_BAND: Tuple[InterestLevel, ...] = (
+    InterestLevel.VERY_LOW,
+    InterestLevel.LOW,
+    InterestLevel.MODERATE,
+    InterestLevel.HIGH,
+    InterestLevel.VERY_HIGH,
+)
+
+# 会話履歴を保持する訪問回数の既定値（SimulationConfig.memory_retention_visitsと同じ）
+_DEFAULT_RETENTION_VISITS = 3
+# 拒否理由の選択時に参照する直近の履歴数
+_REJECTION_MEMORY = 3
+
+
+def _bounded(history: Deque, maxlen: int) -> Deque:
+    """履歴の上限がmaxlenでなければ、直近maxlen件を保持するdequeに作り直す"""
+    if history.maxlen == maxlen:
+        return history
+    return deque(history, maxlen=maxlen)
+
+
+def _days_cutoff(days: int) -> float:
+    """経過日数（timedelta.days）がdays以下となる最古のエポック秒（この値は含まない）"""
+    return time.time() - (days + 1) * 86400
+
+
 class ConversationContext(BaseModel):
     """会話コンテキスト管理モデル"""
 
     last_contact_date: Optional[str] = Field(
-        default_factory=lambda: datetime.now().isoformat(), description="最終接触日"
+        default_factory=now_iso, description="最終接触日"
     )
-    discussed_topics: List[str] = Field(
-        default_factory=list, description="議論されたトピックのリスト"
+    # 履歴は上限付きdequeで保持し、追加時に古い記録を自動的に破棄する
+    discussed_topics: Deque[str] = Field(
+        default_factory=lambda: deque(maxlen=_DEFAULT_RETENTION_VISITS * 2),
+        description="議論されたトピックのリスト",
     )
-    promised_actions: List[str] = Field(
-        default_factory=list, description="約束された行動のリスト"
+    promised_actions: Deque[str] = Field(
+        default_factory=lambda: deque(maxlen=_DEFAULT_RETENTION_VISITS * 2),
+        description="約束された行動のリスト",
     )
-    interest_history: List[InterestScore] = Field(
-        default_factory=list, description="興味度の履歴"
+    interest_history: Deque[InterestScore] = Field(
+        default_factory=lambda: deque(maxlen=_DEFAULT_RETENTION_VISITS),
+        description="興味度の履歴",
     )
-    rejection_history: List[RejectionReason] = Field(
-        default_factory=list, description="拒否理由の履歴"
+    rejection_history: Deque[RejectionReason] = Field(
+        default_factory=lambda: deque(maxlen=_DEFAULT_RETENTION_VISITS),
+        description="拒否理由の履歴",
     )
-    product_discussions: Dict[ProductType, List[str]] = Field(
-        default_factory=lambda: {pt: [] for pt in ProductType},
-        description="商品タイプごとの議論履歴",
+    product_discussions: Dict[ProductType, List[float]] = Field(
+        default_factory=lambda: defaultdict(list),
+        description="商品タイプごとの議論履歴（UNIXエポック秒、議論した商品のみ）",
     )
 
     class Config:
         arbitrary_types_allowed = True
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # 商品タイプごとの議論履歴の初期化を確実に行う
-        if not self.product_discussions:
-            self.product_discussions = {pt: [] for pt in ProductType}
+    @field_validator("discussed_topics", "promised_actions", mode="after")
+    @classmethod
+    def _bound_topic_history(cls, v: Deque) -> Deque:
+        """リストから復元された履歴に上限を設定"""
+        return _bounded(v, v.maxlen or _DEFAULT_RETENTION_VISITS * 2)
+
+    @field_validator("interest_history", "rejection_history", mode="after")
+    @classmethod
+    def _bound_visit_history(cls, v: Deque) -> Deque:
+        """リストから復元された履歴に上限を設定"""
+        return _bounded(v, v.maxlen or _DEFAULT_RETENTION_VISITS)
+
+    @field_validator("product_discussions", mode="before")
+    @classmethod
+    def _parse_discussion_dates(cls, v: Any) -> Any:
+        """ISO形式で保存された議論日時をエポック秒に変換"""
+        if not isinstance(v, dict):
+            return v
+        return {
+            product_type: [
+                _parse_iso(t).timestamp() if isinstance(t, str) else t for t in times
+            ]
+            for product_type, times in v.items()
+        }
+
+    @field_validator("product_discussions", mode="after")
+    @classmethod
+    def _as_defaultdict(
+        cls, v: Dict[ProductType, List[float]]
+    ) -> Dict[ProductType, List[float]]:
+        """未登録の商品タイプを追記できるようにdefaultdictへ変換"""
+        return v if isinstance(v, defaultdict) else defaultdict(list, v)
+
+    @field_serializer("product_discussions", when_used="json")
+    def _serialize_discussion_dates(
+        self, v: Dict[ProductType, List[float]]
+    ) -> Dict[ProductType, List[str]]:
+        """JSON出力時は議論日時をISO形式に戻す"""
+        return {
+            product_type: [datetime.fromtimestamp(t).isoformat() for t in times]
+            for product_type, times in v.items()
+        }
 
     def cleanup_old_records(self, retention_visits: int = 3):
         """古い記録を削除"""
-        if len(self.interest_history) > retention_visits:
-            self.interest_history = self.interest_history[-retention_visits:]
-        if len(self.rejection_history) > retention_visits:
-            self.rejection_history = self.rejection_history[-retention_visits:]
-        if len(self.discussed_topics) > retention_visits * 2:
-            self.discussed_topics = self.discussed_topics[-(retention_visits * 2) :]
-        if len(self.promised_actions) > retention_visits * 2:
-            self.promised_actions = self.promised_actions[-(retention_visits * 2) :]
+        # 履歴はdequeの上限で切り詰められるため、保持期間が変わった場合のみ作り直す
+        self.interest_history = _bounded(self.interest_history, retention_visits)
+        self.rejection_history = _bounded(self.rejection_history, retention_visits)
+        self.discussed_topics = _bounded(self.discussed_topics, retention_visits * 2)
+        self.promised_actions = _bounded(self.promised_actions, retention_visits * 2)
 
         # 商品別議論履歴の整理
-        current_time = datetime.now()
-        for product_type in self.product_discussions:
-            # retention_visits * 30日より古い記録を削除
-            self.product_discussions[product_type] = [
-                date_str
-                for date_str in self.product_discussions[product_type]
-                if (current_time - datetime.fromisoformat(date_str)).days
-                <= retention_visits * 30
-            ]
+        # retention_visits * 30日より古い記録を削除
+        cutoff = _days_cutoff(retention_visits * 30)
+        for product_type, times in self.product_discussions.items():
+            self.product_discussions[product_type] = [t for t in times if t > cutoff]
 
     def add_topic(self, topic: str):
         """話題を追加"""
@@ -174,31 +568,24 @@ class ConversationContext(BaseModel):
 
     def add_product_discussion(self, product_type: ProductType):
         """商品の議論を記録"""
-        if product_type not in self.product_discussions:
-            self.product_discussions[product_type] = []
-        self.product_discussions[product_type].append(datetime.now().isoformat())
+        self.product_discussions[product_type].append(time.time())
 
     def get_recent_topics(self, limit: int = 3) -> List[str]:
         """最近の話題を取得"""
-        return self.discussed_topics[-limit:]
+        return list(self.discussed_topics)[-limit:]
 
     def get_recent_actions(self, limit: int = 3) -> List[str]:
         """最近の約束した行動を取得"""
-        return self.promised_actions[-limit:]
+        return list(self.promised_actions)[-limit:]
 
     def get_product_discussion_frequency(
         self, product_type: ProductType, days: int = 90
     ) -> int:
         """指定期間内の商品議論回数を取得"""
-        if product_type not in self.product_discussions:
-            return 0
-
-        current_time = datetime.now()
-        return sum(
-            1
-            for date_str in self.product_discussions[product_type]
-            if (current_time - datetime.fromisoformat(date_str)).days <= days
-        )
+        # 未登録のキーを作らないようgetで参照する
+        times = self.product_discussions.get(product_type, ())
+        cutoff = _days_cutoff(days)
+        return sum(1 for t in times if t > cutoff)
 
 
 class BasePersona(BaseModel):
@@ -206,6 +593,28 @@ class BasePersona(BaseModel):
     type: str  # "sales" or "company"
 
 
+class _TraitsTextMixin:
+    """性格特性（personality_traits）を持つペルソナに、プロンプト用の文字列を提供する
+
+    personality_traitsの型はペルソナごとに異なるため、継承するモデル側で定義する。
+    （ここで注釈するとpydanticのフィールドの並び順が変わるため、型チェック時のみ宣言する）
+    """
+
+    if TYPE_CHECKING:
+        personality_traits: Sequence[Enum]
+
+    @cached_property
+    def traits_text(self) -> str:
+        """プロンプト用に性格特性を連結した文字列"""
+        return ", ".join([trait.value for trait in self.personality_traits])
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "personality_traits":
+            # 性格特性が置き換えられた場合は連結した文字列を作り直す
+            self.__dict__.pop("traits_text", None)
+
+
 class SalesAttempt(BaseModel):
     product_type: ProductType
     description: str
@@ -223,7 +632,7 @@ class SalesProgress(BaseModel):
     customer_interest: Dict[ProductType, float] = Field(default_factory=dict)
 
 
-class SalesPersona(BasePersona):
+class SalesPersona(_TraitsTextMixin, BasePersona):
     name: str
     age: int
     area: str
@@ -239,46 +648,39 @@ class SalesPersona(BasePersona):
     adaptability: float = Field(ge=0.0, le=1.0)  # 適応力
     product_knowledge: float = Field(ge=0.0, le=1.0)  # 商品知識
 
-    def calculate_success_rate(self) -> float:
-        """経験値と性格特性に基づいて成功率を計算"""
-        base_rate = 0.5
-
-        # 経験値による調整
-        experience_multiplier = {
-            ExperienceLevel.JUNIOR: 0.7,
-            ExperienceLevel.MIDDLE: 0.85,
-            ExperienceLevel.SENIOR: 1.0,
-            ExperienceLevel.VETERAN: 1.2,
-        }
+    # 基本成功率×経験値×性格特性の係数（生成後は変化しないため事前計算）
+    _trait_experience_factor: float = PrivateAttr(default=_BASE_SUCCESS_RATE)
 
-        # 性格特性による調整
-        trait_multipliers = {
-            PersonalityTrait.AGGRESSIVE: 1.1,
-            PersonalityTrait.CAUTIOUS: 0.9,
-            PersonalityTrait.FRIENDLY: 1.05,
-            PersonalityTrait.PROFESSIONAL: 1.15,
-            PersonalityTrait.INEXPERIENCED: 0.8,
-            PersonalityTrait.KNOWLEDGEABLE: 1.1,
-            PersonalityTrait.IMPATIENT: 0.9,
-            PersonalityTrait.PATIENT: 1.05,
-        }
-
-        # 基本成功率の計算
-        success_rate = base_rate * experience_multiplier[self.experience_level]
+    def model_post_init(self, __context: Any) -> None:
+        self._trait_experience_factor = (
+            _BASE_SUCCESS_RATE
+            * _EXPERIENCE_MULTIPLIERS[self.experience_level]
+            * prod(map(_TRAIT_MULTIPLIERS.__getitem__, self.personality_traits))
+        )
 
-        # 性格特性による調整
-        for trait in self.personality_traits:
-            success_rate *= trait_multipliers[trait]
+    @cached_property
+    def profile_prompt(self) -> str:
+        """メール生成プロンプトに埋め込む営業担当者情報"""
+        return _SALES_PROFILE_PROMPT.format(
+            name=self.name,
+            experience_level=self.experience_level.value,
+            traits=self.traits_text,
+            specialties=", ".join(self.specialties),
+        )
 
-        # その他の属性による調整
-        success_rate *= 0.3 + 0.7 * self.stress_tolerance
-        success_rate *= 0.3 + 0.7 * self.adaptability
-        success_rate *= 0.3 + 0.7 * self.product_knowledge
+    def calculate_success_rate(self) -> float:
+        """経験値と性格特性に基づいて成功率を計算"""
+        # 経験値と性格特性による調整は生成時に計算済み、その他の属性による調整のみ行う
+        success_rate = self._trait_experience_factor * (
+            (0.3 + 0.7 * self.stress_tolerance)
+            * (0.3 + 0.7 * self.adaptability)
+            * (0.3 + 0.7 * self.product_knowledge)
+        )
 
-        return min(1.0, max(0.0, success_rate))
+        return clamp01(success_rate)
 
 
-class CompanyContactPersona(BasePersona):
+class CompanyContactPersona(_TraitsTextMixin, BasePersona):
     """企業担当者のペルソナ"""
 
     name: str
@@ -294,59 +696,41 @@ class CompanyContactPersona(BasePersona):
     adaptability: float = Field(ge=0.0, le=1.0)  # 適応力
     content: str  # 元のテキスト形式の内容を保持
 
+    _trait_mask: int = PrivateAttr(default=0)  # personality_traitsのビットマスク
+
+    def model_post_init(self, __context: Any) -> None:
+        self._trait_mask = _customer_trait_mask(self.personality_traits)
+
     def calculate_response_style(self) -> Dict[str, float]:
         """性格特性に基づいて応答スタイルを計算"""
-        style = {
-            "formality": 0.5,  # フォーマル度
-            "detail": 0.5,  # 詳細度
-            "speed": 0.5,  # 返信速度
-            "cooperation": 0.5,  # 協力度
-        }
+        formality = 0.5  # フォーマル度
+        detail = 0.5  # 詳細度
+        speed = 0.5  # 返信速度
+        cooperation = 0.5  # 協力度
 
         # 性格特性による調整
         for trait in self.personality_traits:
-            if trait == CustomerPersonalityTrait.AUTHORITATIVE:
-                style["formality"] += 0.2
-                style["cooperation"] -= 0.1
-            elif trait == CustomerPersonalityTrait.COOPERATIVE:
-                style["cooperation"] += 0.2
-                style["speed"] += 0.1
-            elif trait == CustomerPersonalityTrait.SKEPTICAL:
-                style["detail"] += 0.2
-                style["speed"] -= 0.1
-            elif trait == CustomerPersonalityTrait.TRUSTING:
-                style["cooperation"] += 0.2
-                style["speed"] += 0.1
-            elif trait == CustomerPersonalityTrait.DETAIL_ORIENTED:
-                style["detail"] += 0.3
-                style["speed"] -= 0.2
-            elif trait == CustomerPersonalityTrait.BIG_PICTURE:
-                style["detail"] -= 0.2
-                style["speed"] += 0.1
-            elif trait == CustomerPersonalityTrait.IMPULSIVE:
-                style["speed"] += 0.3
-                style["detail"] -= 0.2
-            elif trait == CustomerPersonalityTrait.ANALYTICAL:
-                style["detail"] += 0.3
-                style["speed"] -= 0.2
+            d_formality, d_detail, d_speed, d_cooperation = _RESPONSE_STYLE_DELTAS[
+                trait
+            ]
+            formality += d_formality
+            detail += d_detail
+            speed += d_speed
+            cooperation += d_cooperation
 
         # その他の属性による調整
-        style["formality"] += (
-            0.1 * self.years_in_company / 10
-        )  # 年数によるフォーマル度の増加
-        style["detail"] += (
-            0.2 * self.financial_literacy
-        )  # 金融リテラシーによる詳細度の増加
-        style["speed"] += 0.2 * self.adaptability  # 適応力による速度の増加
-        style["cooperation"] += (
-            0.2 * self.stress_tolerance
-        )  # ストレス耐性による協力度の増加
+        formality += 0.1 * self.years_in_company / 10  # 年数によるフォーマル度の増加
+        detail += 0.2 * self.financial_literacy  # 金融リテラシーによる詳細度の増加
+        speed += 0.2 * self.adaptability  # 適応力による速度の増加
+        cooperation += 0.2 * self.stress_tolerance  # ストレス耐性による協力度の増加
 
         # 値を0.0-1.0の範囲に制限
-        for key in style:
-            style[key] = max(0.0, min(1.0, style[key]))
-
-        return style
+        return {
+            "formality": clamp01(formality),
+            "detail": clamp01(detail),
+            "speed": clamp01(speed),
+            "cooperation": clamp01(cooperation),
+        }
 
 
 class NegotiationStage(str, Enum):
@@ -367,14 +751,12 @@ class NegotiationProgress(BaseModel):
     decision_criteria: List[str] = Field(default_factory=list)
     required_information: List[str] = Field(default_factory=list)
     evaluation_points: Dict[str, float] = Field(default_factory=dict)
-    last_updated: str = Field(
-        default_factory=lambda: datetime.now().isoformat()
-    )  # datetimeの代わりにstrを使用
+    last_updated: str = Field(default_factory=now_iso)  # datetimeの代わりにstrを使用
 
     def update_stage(self, new_stage: NegotiationStage):
         """商談段階を更新"""
         self.stage = new_stage
-        self.last_updated = datetime.now().isoformat()
+        self.last_updated = now_iso()
 
     def add_concern(self, concern: str):
         """懸念事項を追加"""
@@ -393,7 +775,7 @@ class NegotiationProgress(BaseModel):
     @property
     def last_updated_datetime(self) -> datetime:
         """last_updatedをdatetime型で取得"""
-        return datetime.fromisoformat(self.last_updated)
+        return _parse_iso(self.last_updated)
 
     class Config:
         json_schema_extra = {
@@ -422,14 +804,12 @@ class DecisionMaking(BaseModel):
         """最終判断を記録"""
         self.final_decision = decision
         self.decision_reason = reason
-        self.decision_date = datetime.now().isoformat()
+        self.decision_date = now_iso()
 
     @property
     def decision_date_datetime(self) -> Optional[datetime]:
         """decision_dateをdatetime型で取得"""
-        return (
-            datetime.fromisoformat(self.decision_date) if self.decision_date else None
-        )
+        return _parse_iso(self.decision_date) if self.decision_date else None
 
     class Config:
         json_schema_extra = {
@@ -444,7 +824,7 @@ class DecisionMaking(BaseModel):
         }
 
 
-class CompanyPersona(BasePersona):
+class CompanyPersona(_TraitsTextMixin, BasePersona):
     name: str
     location: str
     industry: str
@@ -460,15 +840,10 @@ class CompanyPersona(BasePersona):
     decision_making_style: str
     risk_tolerance: float = Field(ge=0.0, le=1.0)
     financial_literacy: float = Field(ge=0.0, le=1.0)
-    interest_products: Dict[ProductType, float] = Field(
-        default_factory=lambda: {
-            ProductType.LOAN: 0.5,
-            ProductType.INVESTMENT: 0.5,
-            ProductType.DEPOSIT: 0.5,
-            ProductType.INSURANCE: 0.5,
-            ProductType.OTHER: 0.5,
-        }
-    )
+    # 商品タイプの定義順に並べた興味度（入力は商品タイプをキーとする辞書も可）
+    interest_products: Annotated[
+        List[float], WithJsonSchema(_INTEREST_PRODUCTS_SCHEMA, mode="validation")
+    ] = Field(default_factory=_default_interest_products)
     contact_person: Optional[CompanyContactPersona] = None
 
     conversation_context: ConversationContext = Field(
@@ -479,10 +854,12 @@ class CompanyPersona(BasePersona):
             score=50.0,
             level=InterestLevel.MODERATE,
             factors={},
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso(),
         )
     )
-    rejection_reasons: List[RejectionReason] = Field(default_factory=list)
+    rejection_reasons: Deque[RejectionReason] = Field(
+        default_factory=lambda: deque(maxlen=_REJECTION_MEMORY)
+    )
     response_history: List[ResponseType] = Field(default_factory=list)
     negotiation_progress: NegotiationProgress = Field(
         default_factory=lambda: NegotiationProgress(
@@ -491,48 +868,90 @@ class CompanyPersona(BasePersona):
             decision_criteria=[],
             required_information=[],
             evaluation_points={},
-            last_updated=datetime.now().isoformat(),
+            last_updated=now_iso(),
         )
     )
     decision_making: DecisionMaking = Field(default_factory=DecisionMaking)
 
+    _trait_mask: int = PrivateAttr(default=0)  # personality_traitsのビットマスク
+    # 評価器のキャッシュ（企業情報が変わるupdate_situationで破棄）
+    _evaluator: Optional[ProposalEvaluator] = PrivateAttr(default=None)
+    # 資金ニーズの分解結果（_split_financial_needs）と、それを基に最後に書き込んだ資金ニーズ
+    _financial_need_parts: Optional[Tuple[NeedKind, List[str]]] = PrivateAttr(
+        default=None
+    )
+    _annotated_financial_needs: Optional[str] = PrivateAttr(default=None)
+    # 売上規模（億円）の数値と、それを基に最後に書き込んだ売上規模の文字列
+    _annual_sales_value: float = PrivateAttr(default=0.0)
+    _annual_sales_text: Optional[str] = PrivateAttr(default=None)
+    # 状況更新・応答タイプ・拒否理由の選択で使うペルソナごとの乱数生成器
+    # （グローバルの乱数から種を取る。並行して生成する場合はseed_rngで種を固定する）
+    _rng: random.Random = PrivateAttr(default_factory=_new_persona_rng)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._trait_mask = _customer_trait_mask(self.personality_traits)
+
+    def seed_rng(self, seed: int) -> None:
+        """ペルソナの乱数生成器を指定した種で作り直す"""
+        self._rng = random.Random(seed)
+
+    @field_validator("rejection_reasons", mode="after")
+    @classmethod
+    def _bound_rejection_reasons(cls, v: Deque) -> Deque:
+        """リストから復元された拒否理由の履歴に上限を設定"""
+        return _bounded(v, _REJECTION_MEMORY)
+
+    @field_validator("interest_products", mode="before")
+    @classmethod
+    def _parse_interest_products(cls, value: Any) -> Any:
+        """商品タイプをキーとする辞書を定義順のリストに変換"""
+        if isinstance(value, dict):
+            return _interest_products_list(value)
+        return value
+
+    @field_validator("interest_products", mode="after")
+    @classmethod
+    def _check_interest_products_length(cls, value: List[float]) -> List[float]:
+        """商品タイプの数と一致することを確認"""
+        if len(value) != len(_PRODUCT_TYPES):
+            raise ValueError(
+                f"interest_products must have {len(_PRODUCT_TYPES)} entries"
+            )
+        return value
+
+    @property
+    def interest_products_dict(self) -> Dict[ProductType, float]:
+        """商品タイプをキーとする興味度の辞書"""
+        return dict(zip(_PRODUCT_TYPES, self.interest_products))
+
+    @property
+    def interest_products_by_value(self) -> Dict[str, float]:
+        """商品タイプの値をキーとする興味度の辞書"""
+        return dict(zip(_PRODUCT_TYPE_VALUES, self.interest_products))
+
+    def interest(self, product_type: ProductType) -> float:
+        """指定した商品タイプへの興味度を取得"""
+        return self.interest_products[_PRODUCT_INDEX[product_type]]
+
+    @field_validator("annual_sales", mode="before")
+    @classmethod
+    def _normalize_annual_sales(cls, value: Any) -> Any:
+        """数値で渡された年商を「XX億円」形式の文字列に揃える"""
+        if isinstance(value, (int, float)):
+            return f"{float(value):.1f}億円"
+        return value
+
     @classmethod
     def model_validate(cls, value, **kwargs):
         if isinstance(value, dict):
-            # current_interest_scoreのデフォルト値を設定
-            if (
-                "current_interest_score" not in value
-                or not value["current_interest_score"]
-            ):
-                value["current_interest_score"] = InterestScore(
-                    score=50.0,
-                    level=InterestLevel.MODERATE,
-                    factors={},
-                    timestamp=datetime.now().isoformat(),
-                ).model_dump()
-            # negotiation_progressのデフォルト値を設定
-            if "negotiation_progress" not in value:
-                value["negotiation_progress"] = NegotiationProgress().model_dump()
-            elif isinstance(value["negotiation_progress"], dict):
-                # 既存のnegotiation_progressを補完
-                default_progress = NegotiationProgress().model_dump()
-                for key, default_value in default_progress.items():
-                    if (
-                        key not in value["negotiation_progress"]
-                        or not value["negotiation_progress"][key]
-                    ):
-                        value["negotiation_progress"][key] = default_value
-            # conversation_contextのデフォルト値を設定
-            if "conversation_context" not in value:
-                value["conversation_context"] = ConversationContext().model_dump()
-            # interest_productsのデフォルト値を設定
-            if "interest_products" not in value:
-                value["interest_products"] = {
-                    ProductType.LOAN.value: 0.5,
-                    ProductType.INVESTMENT.value: 0.5,
-                    ProductType.DEPOSIT.value: 0.5,
-                    ProductType.INSURANCE.value: 0.5,
-                    ProductType.OTHER.value: 0.5,
+            # 未設定・空の値はフィールドのdefault_factoryで補完させる
+            # （既定値をmodel_dumpして再検証する往復を避ける）
+            if not value.get("current_interest_score"):
+                value.pop("current_interest_score", None)
+            progress = value.get("negotiation_progress")
+            if isinstance(progress, dict):
+                value["negotiation_progress"] = {
+                    key: item for key, item in progress.items() if item
                 }
 
         return super().model_validate(value, **kwargs)
@@ -572,22 +991,6 @@ class CompanyPersona(BasePersona):
             }
         }
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # 会話コンテキストの初期化を確実に行う
-        if not hasattr(self, "conversation_context"):
-            self.conversation_context = ConversationContext()
-        # 興味度スコアの初期化
-        if not hasattr(self, "current_interest_score"):
-            self.current_interest_score = InterestScore(
-                score=50.0,
-                level=InterestLevel.MODERATE,
-                factors={},
-            )
-        # 商品への興味度の初期化
-        if not hasattr(self, "interest_products"):
-            self.interest_products = {product_type: 0.5 for product_type in ProductType}
-
     def validate_product_type(
         self, product_type: Optional[ProductType]
     ) -> Optional[ProductType]:
@@ -605,11 +1008,46 @@ class CompanyPersona(BasePersona):
         """
         if product_type is None:
             return None
-        try:
-            return ProductType(product_type.value)
-        except ValueError:
+        validated = _PRODUCT_BY_VALUE.get(getattr(product_type, "value", product_type))
+        if validated is None:
             print(f"Warning: Invalid product type {product_type}, defaulting to None")
-            return None
+        return validated
+
+    @cached_property
+    def _interest_prompt_prefix(self) -> str:
+        """興味度評価プロンプトのうち企業ごとに不変な前半部分"""
+        return _INTEREST_PROMPT_PREFIX.format(
+            name=self.name,
+            industry=self.industry,
+            business_description=self.business_description,
+            employee_count=self.employee_count,
+            annual_sales=self.annual_sales,
+            financial_needs=self.financial_needs,
+            position=self.contact_person.position if self.contact_person else "不明",
+            traits=self.traits_text,
+            decision_making_style=self.decision_making_style,
+            risk_tolerance=self.risk_tolerance,
+            financial_literacy=self.financial_literacy,
+        )
+
+    @cached_property
+    def company_profile_prompt(self) -> str:
+        """メール生成プロンプトに埋め込む企業情報"""
+        return _COMPANY_PROFILE_PROMPT.format(
+            name=self.name,
+            industry=self.industry,
+            business_description=self.business_description,
+            financial_needs=self.financial_needs,
+        )
+
+    @cached_property
+    def contact_profile_prompt(self) -> str:
+        """メール生成プロンプトに埋め込む企業担当者情報"""
+        contact = self.contact_person
+        return _CONTACT_PROFILE_PROMPT.format(
+            name=contact.name if contact else "不明",
+            position=contact.position if contact else "不明",
+        )
 
     def calculate_interest_score_with_llm(
         self,
@@ -627,42 +1065,13 @@ class CompanyPersona(BasePersona):
 
         try:
             # 企業担当者の視点でメッセージを評価するためのプロンプト
-            prompt = f"""
-            あなたは以下の特性を持つ企業の担当者です：
-
-            企業情報：
-            - 企業名：{self.name}
-            - 業種：{self.industry}
-            - 事業内容：{self.business_description}
-            - 規模：従業員数{self.employee_count}名、売上{self.annual_sales}
-            - 資金ニーズ：{self.financial_needs}
-
-            あなたの特性：
-            - 役職：{self.contact_person.position if self.contact_person else "不明"}
-            - 性格：{", ".join([trait.value for trait in self.personality_traits])}
-            - 意思決定スタイル：{self.decision_making_style}
-            - リスク許容度：{self.risk_tolerance}
-            - 金融リテラシー：{self.financial_literacy}
-
-            以下の営業担当者からのメッセージに対する、あなたの興味度を0から100の数値で評価してください。
-            評価の際は以下の要素を考慮してください：
-            - メッセージの内容と自社のニーズとの適合性
-            - 提案内容の具体性と実現可能性
-            - 自社の状況との整合性
-            - あなたの性格や意思決定スタイルとの相性
-
-            商品タイプ：{validated_product_type.value if validated_product_type else "不明"}
-
-            メッセージ内容：
-            {message_content}
-
-            以下のJSON形式で回答してください：
-            {{
-                "interest_score": 数値（0-100）,
-                "reasoning": "スコアの理由の説明",
-                "key_factors": ["考慮した主な要因をリストで"]
-            }}
-            """
+            # 企業ごとに不変な前半部分を先頭に置き、商品タイプとメッセージのみを差し込む
+            prompt = self._interest_prompt_prefix + _INTEREST_PROMPT_TAIL.format(
+                product_type=(
+                    validated_product_type.value if validated_product_type else "不明"
+                ),
+                message_content=message_content,
+            )
 
             # LLMからの応答を取得
             try:
@@ -670,6 +1079,9 @@ class CompanyPersona(BasePersona):
                     messages=[{"role": "user", "content": prompt}],
                     response_model=InterestScoreResponse,
                     temperature=0.3,  # 一貫性のために低めの温度を設定
+                    # 同じプロンプトの評価は同じ結果とみなし、クライアントの応答キャッシュを使う
+                    # （企業情報はプロンプトに含まれるため、状況が更新されれば別のキーになる）
+                    cacheable=True,
                 )
             except Exception as api_error:
                 print(f"Error calling OpenAI API: {api_error}")
@@ -690,7 +1102,7 @@ class CompanyPersona(BasePersona):
                         response.interest_score, config
                     ),
                     factors=factors,
-                    timestamp=datetime.now().isoformat(),
+                    timestamp=now_iso(),
                 )
 
                 # 履歴の更新
@@ -716,16 +1128,7 @@ class CompanyPersona(BasePersona):
         config: Optional[SimulationConfig] = None,
     ) -> InterestScore:
         """キーワードベースで興味度スコアを計算（従来の実装）"""
-        evaluator = ProposalEvaluator(
-            risk_tolerance=self.risk_tolerance,
-            financial_literacy=self.financial_literacy,
-            annual_sales=self.annual_sales,
-            industry=self.industry,
-            personality_traits=[trait.value for trait in self.personality_traits],
-            interest_products={
-                pt.value: score for pt, score in self.interest_products.items()
-            },
-        )
+        evaluator = self._get_evaluator()
 
         product_type_str = product_type.value if product_type else None
         interest_score = evaluator.calculate_interest_score(
@@ -735,7 +1138,7 @@ class CompanyPersona(BasePersona):
         # InterestScoreをProductTypeを使用する形式に変換
         converted_score = InterestScore(
             score=interest_score.score,
-            product_type=ProductType(interest_score.product_type)
+            product_type=_PRODUCT_BY_VALUE[interest_score.product_type]
             if interest_score.product_type
             else None,
             level=interest_score.level,
@@ -786,36 +1189,30 @@ class CompanyPersona(BasePersona):
         score_to_use = interest_score or self.current_interest_score
 
         # 性格特性による基準値の調整
-        threshold_modifier = 0.0
-        for trait in self.personality_traits:
-            if trait == CustomerPersonalityTrait.COOPERATIVE:
-                threshold_modifier += 5.0
-            elif trait == CustomerPersonalityTrait.SKEPTICAL:
-                threshold_modifier -= 5.0
+        threshold_modifier = sum(
+            _RESPONSE_THRESHOLD_MODIFIERS.get(trait, 0.0)
+            for trait in self.personality_traits
+        )
 
         # 設定パラメータから閾値を取得
-        thresholds = {
-            "acceptance": 80.0,
-            "positive": 60.0,
-            "question": 40.0,
-            "neutral": 20.0,
-        }
+        thresholds = _DEFAULT_RESPONSE_THRESHOLDS
         if config and config.response_type_thresholds:
-            thresholds.update(config.response_type_thresholds)
+            thresholds = {**thresholds, **config.response_type_thresholds}
+        # 補正済みの境界値（閾値は昇順であることを前提とする）
+        boundaries = (
+            thresholds["neutral"] + threshold_modifier,
+            thresholds["question"] + threshold_modifier,
+            thresholds["positive"] + threshold_modifier,
+            thresholds["acceptance"] + threshold_modifier,
+        )
 
         # スコアに基づく応答タイプの決定
-        adjusted_score = score_to_use.score
-        if adjusted_score >= (thresholds["acceptance"] + threshold_modifier):
-            response_type = ResponseType.ACCEPTANCE
-        elif adjusted_score >= (thresholds["positive"] + threshold_modifier):
-            response_type = ResponseType.POSITIVE
-        elif adjusted_score >= (thresholds["question"] + threshold_modifier):
-            response_type = ResponseType.QUESTION
-        elif adjusted_score >= (thresholds["neutral"] + threshold_modifier):
-            response_type = ResponseType.NEUTRAL
+        index = bisect_right(boundaries, score_to_use.score)
+        if index:
+            response_type = _RESPONSE_TYPES_BY_BOUNDARY[index - 1]
         else:
             # 低スコアの場合、一定確率で明確な拒否か返信なしを選択
-            if random.random() < 0.3:  # 30%の確率で
+            if self._rng.random() < 0.3:  # 30%の確率で
                 response_type = ResponseType.NO_RESPONSE
             else:
                 response_type = ResponseType.REJECTION
@@ -826,35 +1223,23 @@ class CompanyPersona(BasePersona):
 
     def select_rejection_reason(self) -> RejectionReason:
         """現在の状況に基づいて適切な拒否理由を選択"""
-        # 性格特性と過去の拒否理由を考慮
-        available_reasons = list(RejectionReason)
-
-        # 性格特性による重み付け
-        weights = [1.0] * len(available_reasons)
-        for trait in self.personality_traits:
-            if trait == CustomerPersonalityTrait.ANALYTICAL:
-                # 分析的な性格は予算やコストの懸念を重視
-                weights[available_reasons.index(RejectionReason.BUDGET_CONSTRAINT)] *= (
-                    1.5
-                )
-                weights[available_reasons.index(RejectionReason.COST_CONCERN)] *= 1.5
-            elif trait == CustomerPersonalityTrait.SKEPTICAL:
-                # 懐疑的な性格はリスクや代替案を重視
-                weights[available_reasons.index(RejectionReason.RISK_CONCERN)] *= 1.5
-                weights[
-                    available_reasons.index(RejectionReason.ALTERNATIVE_SOLUTION)
-                ] *= 1.5
+        # 性格特性による重み付け（性格特性の組み合わせごとにキャッシュ）
+        weights = list(_rejection_trait_weights(tuple(self.personality_traits)))
 
         # 過去に使用した理由は避ける
-        for used_reason in self.rejection_reasons[-3:]:  # 直近3回の理由
-            if used_reason in available_reasons:
-                idx = available_reasons.index(used_reason)
-                weights[idx] *= 0.5
-
-        # 重み付けに基づいて理由を選択
-        total_weight = sum(weights)
-        normalized_weights = [w / total_weight for w in weights]
-        selected_reason = random.choices(available_reasons, normalized_weights, k=1)[0]
+        for used_reason in self.rejection_reasons:  # 直近3回の理由
+            weights[_REJECTION_INDEX[used_reason]] *= 0.5
+
+        # 重み付けに基づいて理由を選択（累積重みを二分探索）
+        cum_weights = list(accumulate(weights))
+        selected_reason = _REJECTION_REASONS[
+            bisect_right(
+                cum_weights,
+                self._rng.random() * cum_weights[-1],
+                0,
+                len(cum_weights) - 1,
+            )
+        ]
 
         # 履歴の更新
         self.rejection_reasons.append(selected_reason)
@@ -862,167 +1247,112 @@ class CompanyPersona(BasePersona):
 
     def update_situation(self, days_passed: int) -> None:
         """経過日数に応じて企業の状況を更新する"""
-        # 変化率の初期化
-        sales_change_rate = 0.0
-        employee_change_rate = 0.0
+        # 企業情報が変わるため、キャッシュしたプロンプト・評価器を破棄
+        for name in _PROMPT_CACHE_ATTRS:
+            self.__dict__.pop(name, None)
+        self._evaluator = None
+
+        # 現在の売上規模（億円）
+        # 前回書き込んだ文字列のままなら、丸める前の数値をそのまま使う
+        if self.annual_sales == self._annual_sales_text:
+            current_sales = self._annual_sales_value
+        else:
+            m = _SALES_FIGURE_RE.search(self.annual_sales)
+            current_sales = float(m.group().replace(",", "")) if m else 10.0
+
+        # 性格特性の判定は一度だけ行う
+        impulsive = bool(self._trait_mask & _IMPULSIVE_BIT)
+
+        # 売上・従業員数・商品への興味度の変化（性格特性に応じて変動幅を調整）
+        new_sales, self.employee_count, sales_change_rate, employee_change_rate = (
+            _update_company_figures(
+                current_sales,
+                self.employee_count,
+                self.interest_products,
+                _SITUATION_VOLATILITIES[self._trait_mask & _VOLATILITY_TRAIT_BITS],
+                self._rng.random,
+            )
+        )
+        self._annual_sales_value = new_sales
+        self.annual_sales = self._annual_sales_text = f"{new_sales:.1f}億円"
 
-        # 売上規模の変化（性格特性に応じて変動幅を調整）
-        try:
-            sales_str = "".join(filter(str.isdigit, self.annual_sales))
-            if not sales_str:
-                current_sales = 10.0
-            else:
-                current_sales = float(sales_str)
-
-            # 性格特性に応じた変動幅の調整
-            volatility = 0.05  # 基本変動幅
-            if CustomerPersonalityTrait.IMPULSIVE in self.personality_traits:
-                volatility *= 1.5
-            if CustomerPersonalityTrait.CAUTIOUS in self.personality_traits:
-                volatility *= 0.7
-
-            sales_change_rate = random.uniform(-volatility, volatility)
-            new_sales = current_sales * (1 + sales_change_rate)
-            self.annual_sales = f"{new_sales:.1f}億円"
-        except (ValueError, AttributeError):
-            pass
-
-        # 従業員数の変化（性格特性に応じて変動幅を調整）
-        try:
-            volatility = 0.02  # 基本変動幅
-            if CustomerPersonalityTrait.IMPULSIVE in self.personality_traits:
-                volatility *= 1.5
-            if CustomerPersonalityTrait.CAUTIOUS in self.personality_traits:
-                volatility *= 0.7
+        # 資金ニーズの変化（性格特性に応じて変化）
+        # 分解結果は資金ニーズが外部から書き換えられたときだけ作り直し、
+        # 毎回は注記だけを差し替えて組み立てる
+        if self.financial_needs != self._annotated_financial_needs:
+            self._financial_need_parts = _split_financial_needs(self.financial_needs)
+        if self._financial_need_parts is not None:
+            kind, parts = self._financial_need_parts
+            urgency = "緊急" if impulsive else "計画"
+            self.financial_needs = (
+                f"{kind.value}（{urgency}、{days_passed}日経過）".join(parts)
+            )
+        self._annotated_financial_needs = self.financial_needs
 
-            employee_change_rate = random.uniform(-volatility, volatility)
-            self.employee_count = int(self.employee_count * (1 + employee_change_rate))
-        except (ValueError, AttributeError):
-            pass
+        # 企業担当者の状況も更新
+        if self.contact_person is None:
+            return
 
-        # 資金ニーズの変化（性格特性に応じて変化）
-        try:
-            if "設備投資" in self.financial_needs:
-                urgency = (
-                    "緊急"
-                    if CustomerPersonalityTrait.IMPULSIVE in self.personality_traits
-                    else "計画"
-                )
-                self.financial_needs = self.financial_needs.replace(
-                    "設備投資", f"設備投資（{urgency}、{days_passed}日経過）"
-                )
-            elif "運転資金" in self.financial_needs:
-                urgency = (
-                    "緊急"
-                    if CustomerPersonalityTrait.IMPULSIVE in self.personality_traits
-                    else "計画"
-                )
-                self.financial_needs = self.financial_needs.replace(
-                    "運転資金", f"運転資金（{urgency}、{days_passed}日経過）"
-                )
-        except (ValueError, AttributeError):
-            pass
+        # ストレス耐性の変化（企業の状況に応じて）
+        # 売上減少や資金ニーズの緊急性が高い場合、ストレスが増加
+        stress_change = 0.0
+        if "減少" in self.annual_sales:
+            stress_change += 0.1
+        if "緊急" in self.financial_needs:
+            stress_change += 0.15
 
-        # 商品への興味度の変化（性格特性に応じて変化）
-        try:
-            for product_type in self.interest_products:
-                # 基本変動幅
-                base_change = 0.1
-
-                # 性格特性による調整
-                if CustomerPersonalityTrait.IMPULSIVE in self.personality_traits:
-                    base_change *= 1.5
-                if CustomerPersonalityTrait.CAUTIOUS in self.personality_traits:
-                    base_change *= 0.7
-                if CustomerPersonalityTrait.ANALYTICAL in self.personality_traits:
-                    base_change *= 0.8
-
-                change = random.uniform(-base_change, base_change)
-                self.interest_products[product_type] = max(
-                    0.0, min(1.0, self.interest_products[product_type] + change)
-                )
-        except (ValueError, AttributeError):
-            pass
+        # 基本変動
+        base_stress_change = self._rng.uniform(-0.05, 0.05)
+        stress_change += base_stress_change
 
-        # 企業担当者の状況も更新
-        if self.contact_person:
-            # ストレス耐性の変化（企業の状況に応じて）
-            try:
-                # 売上減少や資金ニーズの緊急性が高い場合、ストレスが増加
-                stress_change = 0.0
-                if "減少" in self.annual_sales:
-                    stress_change += 0.1
-                if "緊急" in self.financial_needs:
-                    stress_change += 0.15
-
-                # 基本変動
-                base_stress_change = random.uniform(-0.05, 0.05)
-                stress_change += base_stress_change
-
-                # 性格特性による調整
-                if (
-                    CustomerPersonalityTrait.IMPULSIVE
-                    in self.contact_person.personality_traits
-                ):
-                    stress_change *= 1.2
-                if (
-                    CustomerPersonalityTrait.CAUTIOUS
-                    in self.contact_person.personality_traits
-                ):
-                    stress_change *= 0.8
-
-                self.contact_person.stress_tolerance = max(
-                    0.0, min(1.0, self.contact_person.stress_tolerance - stress_change)
-                )
-            except (ValueError, AttributeError):
-                pass
+        # 性格特性による調整
+        if self.contact_person._trait_mask & _IMPULSIVE_BIT:
+            stress_change *= 1.2
 
-            # 適応力の変化（企業の状況に応じて）
-            try:
-                # 企業の変化が大きい場合、適応力が向上
-                adaptability_change = 0.0
-                if (
-                    abs(sales_change_rate) > 0.1 or abs(employee_change_rate) > 0.1
-                ):  # 大きな変化があった場合
-                    adaptability_change += 0.05
-
-                # 基本変動
-                base_adaptability_change = random.uniform(-0.03, 0.03)
-                adaptability_change += base_adaptability_change
-
-                # 性格特性による調整
-                if (
-                    CustomerPersonalityTrait.ANALYTICAL
-                    in self.contact_person.personality_traits
-                ):
-                    adaptability_change *= 1.1
-                if (
-                    CustomerPersonalityTrait.IMPULSIVE
-                    in self.contact_person.personality_traits
-                ):
-                    adaptability_change *= 0.9
-
-                self.contact_person.adaptability = max(
-                    0.0,
-                    min(1.0, self.contact_person.adaptability + adaptability_change),
-                )
-            except (ValueError, AttributeError):
-                pass
+        self.contact_person.stress_tolerance = clamp01(
+            self.contact_person.stress_tolerance - stress_change
+        )
+
+        # 適応力の変化（企業の状況に応じて）
+        # 企業の変化が大きい場合、適応力が向上
+        adaptability_change = 0.0
+        if (
+            abs(sales_change_rate) > 0.1 or abs(employee_change_rate) > 0.1
+        ):  # 大きな変化があった場合
+            adaptability_change += 0.05
+
+        # 基本変動
+        base_adaptability_change = self._rng.uniform(-0.03, 0.03)
+        adaptability_change += base_adaptability_change
+
+        # 性格特性による調整
+        if self.contact_person._trait_mask & _ANALYTICAL_BIT:
+            adaptability_change *= 1.1
+        if self.contact_person._trait_mask & _IMPULSIVE_BIT:
+            adaptability_change *= 0.9
+
+        self.contact_person.adaptability = clamp01(
+            self.contact_person.adaptability + adaptability_change
+        )
 
     def evaluate_proposal(self, proposal: Proposal) -> EvaluationResult:
         """提案内容を評価し、判断を行う"""
-        evaluator = ProposalEvaluator(
-            risk_tolerance=self.risk_tolerance,
-            financial_literacy=self.financial_literacy,
-            annual_sales=self.annual_sales,
-            industry=self.industry,
-            personality_traits=[trait.value for trait in self.personality_traits],
-            interest_products={
-                pt.value: score for pt, score in self.interest_products.items()
-            },
-        )
+        evaluator = self._get_evaluator()
         return evaluator.evaluate_proposal(proposal)
 
+    def _get_evaluator(self) -> ProposalEvaluator:
+        """企業情報に基づく評価器を取得（update_situationまで使い回す）"""
+        if self._evaluator is None:
+            self._evaluator = ProposalEvaluator(
+                risk_tolerance=self.risk_tolerance,
+                financial_literacy=self.financial_literacy,
+                annual_sales=self.annual_sales,
+                industry=self.industry,
+                personality_traits=[trait.value for trait in self.personality_traits],
+                interest_products=self.interest_products_by_value,
+            )
+        return self._evaluator
+
     def _determine_interest_level(
         self, score: float, config: Optional[SimulationConfig] = None
     ) -> InterestLevel:
@@ -1036,29 +1366,16 @@ class CompanyPersona(BasePersona):
         Returns:
             InterestLevel: 判定された興味レベル
         """
+        bands = _DEFAULT_INTEREST_BANDS
         if config and config.interest_score_thresholds:
             thresholds = config.interest_score_thresholds
-            if score >= thresholds.get("very_high", 80.0):
-                return InterestLevel.VERY_HIGH
-            elif score >= thresholds.get("high", 60.0):
-                return InterestLevel.HIGH
-            elif score >= thresholds.get("moderate", 40.0):
-                return InterestLevel.MODERATE
-            elif score >= thresholds.get("low", 20.0):
-                return InterestLevel.LOW
-            else:
-                return InterestLevel.VERY_LOW
-        else:
-            if score >= 80:
-                return InterestLevel.VERY_HIGH
-            elif score >= 60:
-                return InterestLevel.HIGH
-            elif score >= 40:
-                return InterestLevel.MODERATE
-            elif score >= 20:
-                return InterestLevel.LOW
-            else:
-                return InterestLevel.VERY_LOW
+            bands = (
+                thresholds.get("low", 20.0),
+                thresholds.get("moderate", 40.0),
+                thresholds.get("high", 60.0),
+                thresholds.get("very_high", 80.0),
+            )
+        return _INTEREST_LEVELS_BY_BAND[bisect_right(bands, score)]
 
 
 class Assignment(BaseModel):
@@ -1069,14 +1386,19 @@ class Assignment(BaseModel):
     )  # company_id -> progress
 
 
-class SessionHistory(BaseModel):
+@dataclass(slots=True)
+class SessionHistory:
+    """セッション内の1メッセージ分の記録
+
+    大量に生成されるためslots付きdataclassとし、検証はSessionSummaryなど
+    Pydanticモデルの境界でのみ行う。
+    """
+
     role: str
     content: str
     product_type: Optional[ProductType] = None
     success_score: Optional[float] = None
-    timestamp: str = Field(
-        default_factory=lambda: datetime.now().isoformat()
-    )  # ISO形式に統一
+    timestamp: str = field(default_factory=now_iso)  # ISO形式に統一
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the history entry to a plain dictionary."""
@@ -1091,17 +1413,6 @@ class SessionHistory(BaseModel):
             result["success_score"] = self.success_score
         return result
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "role": "assistant",
-                "content": "メッセージ内容",
-                "product_type": None,
-                "success_score": None,
-                "timestamp": datetime.now().isoformat(),
-            }
-        }
-
 
 class SessionSummary(BaseModel):
     session_num: int
@@ -1112,7 +1423,8 @@ class SessionSummary(BaseModel):
     matched_products: List[ProductType]
 
 
-class MeetingLog(BaseModel):
+@dataclass(slots=True)
+class MeetingLog:
     session_num: int
     visit_date: str  # 訪問日を追加
     content: str
@@ -49,6 +49,8 @@ class SimulationConfig:
     )
 
     memory_retention_visits: int = 3  # 何回前の訪問まで記憶として保持するか
+    max_concurrent_requests: int = 8  # 並行して送信するAPIリクエスト数の上限
+    cache_enabled: bool = True  # 興味度評価などの同じ呼び出しの応答をキャッシュするか
 
 
 @dataclass
@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.models.evaluation import (
     EvaluationCriteria,
@@ -7,8 +7,61 @@ from src.models.evaluation import (
     InterestLevel,
     InterestScore,
     Proposal,
+    clamp01,
+    now,
+    now_iso,
 )
 
+# 評価スコアはEvaluationCriteriaの定義順に並べたタプルで保持する
+Scores = Tuple[float, ...]
+_ALL_CRITERIA: Tuple[str, ...] = tuple(c.value for c in EvaluationCriteria)
+_COST, _RISK, _BENEFIT, _FEASIBILITY, _SUPPORT, _TRACK_RECORD = range(
+    len(_ALL_CRITERIA)
+)
+# 判断に必須の評価基準（コスト・リスク・ベネフィット）のビットマスク
+_ESSENTIAL_CRITERIA_MASK = (1 << _COST) | (1 << _RISK) | (1 << _BENEFIT)
+# 懸念事項の判定ルール（スコアの添字, 閾値, 懸念事項）
+_CONCERN_RULES: Tuple[Tuple[int, float, str], ...] = (
+    (_COST, 0.6, "コストが高い"),
+    (_RISK, 0.6, "リスクが高い"),
+    (_FEASIBILITY, 0.6, "実現可能性に不安がある"),
+    (_SUPPORT, 0.6, "サポート体制が不十分"),
+    (_TRACK_RECORD, 0.6, "実績が不十分"),
+)
+
+# 興味レベルの境界値と、境界値以上となった数に対応する興味レベル
+_INTEREST_BANDS: Tuple[float, ...] = (20.0, 40.0, 60.0, 80.0)
+_INTEREST_LEVELS_BY_BAND: Tuple[InterestLevel, ...] = (
+    InterestLevel.VERY_LOW,
+    InterestLevel.LOW,
+    InterestLevel.MODERATE,
+    InterestLevel.HIGH,
+    InterestLevel.VERY_HIGH,
+)
+
+# メッセージ内容の分析に使うキーワードと、1語あたりのスコアの増減
+_POSITIVE_KEYWORDS: Tuple[str, ...] = (
+    "ご検討",
+    "興味",
+    "詳細",
+    "ご提案",
+    "承知",
+    "ありがとう",
+    "期待",
+    "前向き",
+)
+_NEGATIVE_KEYWORDS: Tuple[str, ...] = (
+    "結構です",
+    "見送り",
+    "他社",
+    "予算",
+    "時期",
+    "難しい",
+    "検討中",
+    "保留",
+)
+_KEYWORD_WEIGHT = 5.0
+
 
 class ProposalEvaluator:
     """提案評価を行うクラス"""
@@ -25,32 +78,43 @@ class ProposalEvaluator:
         self.risk_tolerance = risk_tolerance
         self.financial_literacy = financial_literacy
         self.annual_sales = annual_sales
+        self._annual_sales_num = self._parse_annual_sales(annual_sales)
         self.industry = industry
         self.personality_traits = personality_traits
+        # 判断時の性格特性の確認用（呼び出しごとにリストを走査しない）
+        self._traits = frozenset(personality_traits)
         self.interest_products = interest_products or {}
 
+    @staticmethod
+    def _parse_annual_sales(annual_sales: Any) -> Optional[float]:
+        """年商を数値に変換（変換できない場合はNone）"""
+        try:
+            return float(annual_sales)
+        except (ValueError, TypeError):
+            return None
+
     def evaluate_proposal(self, proposal: Proposal) -> EvaluationResult:
         """提案内容を評価し、判断を行う"""
         scores = self._calculate_evaluation_scores(proposal)
-        concerns = self._identify_remaining_concerns(proposal)
-        criteria_met = self._check_decision_criteria(proposal)
+        concerns = self._identify_remaining_concerns(scores)
+        criteria_met = self._check_decision_criteria(scores)
 
         if self._is_ready_for_decision(scores, concerns, criteria_met):
             decision = self._make_final_decision(scores, concerns, criteria_met)
             return EvaluationResult(
                 decision=decision,
-                scores=scores,
+                scores=self._scores_to_dict(scores),
                 concerns=concerns,
                 required_info=None,
-                evaluation_date=datetime.now(),
+                evaluation_date=now(),
             )
         else:
             return EvaluationResult(
                 decision="pending",
-                scores=scores,
+                scores=self._scores_to_dict(scores),
                 concerns=concerns,
                 required_info=self._identify_required_information(proposal),
-                evaluation_date=datetime.now(),
+                evaluation_date=now(),
             )
 
     def calculate_interest_score(
@@ -97,98 +161,57 @@ class ProposalEvaluator:
             product_type=product_type,
             level=interest_level,
             factors=factors,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso(),
         )
 
     def _analyze_message_content(self, message_content: str) -> float:
         """メッセージ内容を分析してスコアを計算"""
-        positive_keywords = [
-            "ご検討",
-            "興味",
-            "詳細",
-            "ご提案",
-            "承知",
-            "ありがとう",
-            "期待",
-            "前向き",
-        ]
-        negative_keywords = [
-            "結構です",
-            "見送り",
-            "他社",
-            "予算",
-            "時期",
-            "難しい",
-            "検討中",
-            "保留",
-        ]
-
-        content_score = 0
-        positive_weight = 5.0
-        negative_weight = -5.0
-
-        for keyword in positive_keywords:
-            if keyword in message_content:
-                content_score += positive_weight
-        for keyword in negative_keywords:
-            if keyword in message_content:
-                content_score += negative_weight
-
-        return content_score
+        # 含まれるキーワードの数を数える（重なり合うキーワードもそれぞれ数える）
+        positive_count = sum(kw in message_content for kw in _POSITIVE_KEYWORDS)
+        negative_count = sum(kw in message_content for kw in _NEGATIVE_KEYWORDS)
+        return _KEYWORD_WEIGHT * (positive_count - negative_count)
 
     def _determine_interest_level(self, score: float) -> InterestLevel:
         """スコアから興味レベルを判定"""
-        if score >= 80:
-            return InterestLevel.VERY_HIGH
-        elif score >= 60:
-            return InterestLevel.HIGH
-        elif score >= 40:
-            return InterestLevel.MODERATE
-        elif score >= 20:
-            return InterestLevel.LOW
-        else:
-            return InterestLevel.VERY_LOW
+        return _INTEREST_LEVELS_BY_BAND[bisect_right(_INTEREST_BANDS, score)]
 
-    def _calculate_evaluation_scores(self, proposal: Proposal) -> Dict[str, float]:
+    def _calculate_evaluation_scores(self, proposal: Proposal) -> Scores:
         """提案内容の各評価基準に対するスコアを計算"""
-        return {
-            EvaluationCriteria.COST.value: self._evaluate_cost(
-                proposal.cost_information
-            ),
-            EvaluationCriteria.RISK.value: self._evaluate_risk(proposal.risks),
-            EvaluationCriteria.BENEFIT.value: self._evaluate_benefits(
-                proposal.benefits
-            ),
-            EvaluationCriteria.FEASIBILITY.value: self._evaluate_feasibility(proposal),
-            EvaluationCriteria.SUPPORT.value: self._evaluate_support(
-                proposal.support_details
-            ),
-            EvaluationCriteria.TRACK_RECORD.value: self._evaluate_track_record(
-                proposal.track_record
-            ),
-        }
-
-    def _evaluate_cost(self, cost_info: Dict[str, Any]) -> float:
+        return (
+            self._evaluate_cost(proposal),
+            self._evaluate_risk(proposal.risks),
+            self._evaluate_benefits(proposal.benefits),
+            self._evaluate_feasibility(proposal),
+            self._evaluate_support(proposal.support_details),
+            self._evaluate_track_record(proposal.track_record),
+        )
+
+    @staticmethod
+    def _scores_to_dict(scores: Scores) -> Dict[str, float]:
+        """スコアのタプルを評価基準名をキーとする辞書に変換"""
+        return dict(zip(_ALL_CRITERIA, scores))
+
+    def _evaluate_cost(self, proposal: Proposal) -> float:
         """コスト面の評価を行う"""
         base_score = 0.5
 
-        if "total_cost" in cost_info:
-            try:
-                cost_ratio = cost_info["total_cost"] / float(self.annual_sales)
-                if cost_ratio < 0.01:  # コストが年商の1%未満
-                    base_score += 0.3
-                elif cost_ratio < 0.05:  # コストが年商の5%未満
-                    base_score += 0.1
-                else:
-                    base_score -= 0.2
-            except (ValueError, TypeError):
-                # 数値変換に失敗した場合はデフォルトスコアを返す
+        if "total_cost" in proposal.cost_information:
+            total_cost = proposal.total_cost_value
+            if total_cost is None or self._annual_sales_num is None:
+                # 総コストまたは年商が数値でない場合はデフォルトスコアを返す
                 return base_score
+            cost_ratio = total_cost / self._annual_sales_num
+            if cost_ratio < 0.01:  # コストが年商の1%未満
+                base_score += 0.3
+            elif cost_ratio < 0.05:  # コストが年商の5%未満
+                base_score += 0.1
+            else:
+                base_score -= 0.2
 
         # リスク許容度による調整
         base_score *= 0.5 + 0.5 * self.risk_tolerance
 
-        return min(1.0, max(0.0, base_score))
+        return clamp01(base_score)
 
     def _evaluate_risk(self, risks: List[str]) -> float:
         """リスク面の評価を行う"""
@@ -207,7 +230,7 @@ class ProposalEvaluator:
         risk_tolerance_factor = 0.5 + 0.5 * self.risk_tolerance
         base_score *= risk_tolerance_factor
 
-        return min(1.0, max(0.0, base_score))
+        return clamp01(base_score)
 
     def _evaluate_benefits(self, benefits: List[str]) -> float:
         """メリット面の評価を行う"""
@@ -221,7 +244,7 @@ class ProposalEvaluator:
         literacy_factor = 0.5 + 0.5 * self.financial_literacy
         base_score *= literacy_factor
 
-        return min(1.0, max(0.0, base_score))
+        return clamp01(base_score)
 
     def _evaluate_feasibility(self, proposal: Proposal) -> float:
         """実現可能性の評価を行う"""
@@ -230,20 +253,15 @@ class ProposalEvaluator:
         # 商品タイプに応じた調整
         if proposal.product_type == "loan":
             # ローンの場合、財務状況との整合性を確認
-            if "annual_sales" in proposal.terms:
-                try:
-                    sales_ratio = float(proposal.terms["annual_sales"]) / float(
-                        self.annual_sales
-                    )
-                    if sales_ratio > 0.5:  # 年商の50%を超える場合
-                        base_score -= 0.3
-                    elif sales_ratio > 0.3:  # 年商の30%を超える場合
-                        base_score -= 0.1
-                except (ValueError, TypeError):
-                    # 数値変換に失敗した場合はデフォルトスコアを返す
-                    return base_score
-
-        return min(1.0, max(0.0, base_score))
+            sales = proposal.terms_annual_sales_value
+            if sales is not None and self._annual_sales_num is not None:
+                sales_ratio = sales / self._annual_sales_num
+                if sales_ratio > 0.5:  # 年商の50%を超える場合
+                    base_score -= 0.3
+                elif sales_ratio > 0.3:  # 年商の30%を超える場合
+                    base_score -= 0.1
+
+        return clamp01(base_score)
 
     def _evaluate_support(self, support_details: Dict[str, Any]) -> float:
         """サポート体制の評価を行う"""
@@ -257,7 +275,7 @@ class ProposalEvaluator:
         if support_details.get("24h_support"):
             base_score += 0.1
 
-        return min(1.0, max(0.0, base_score))
+        return clamp01(base_score)
 
     def _evaluate_track_record(self, track_record: List[Dict[str, Any]]) -> float:
         """実績の評価を行う"""
@@ -266,93 +284,69 @@ class ProposalEvaluator:
         if not track_record:
             return base_score
 
+        # 成功件数と同業種の実績件数を1回の走査で集計
+        success_count = 0
+        industry_matches = 0
+        for record in track_record:
+            if record.get("success", False):
+                success_count += 1
+            if record.get("industry") == self.industry:
+                industry_matches += 1
+
         # 実績数による調整
-        success_count = sum(
-            1 for record in track_record if record.get("success", False)
-        )
         success_ratio = success_count / len(track_record)
-
         base_score += 0.3 * success_ratio
 
         # 同業種の実績による追加ボーナス
-        industry_matches = sum(
-            1 for record in track_record if record.get("industry") == self.industry
-        )
         if industry_matches > 0:
             base_score += 0.2
 
-        return min(1.0, max(0.0, base_score))
+        return clamp01(base_score)
 
-    def _identify_remaining_concerns(self, proposal: Proposal) -> List[str]:
-        """未解決の懸念事項を特定"""
-        concerns = []
-        scores = self._calculate_evaluation_scores(proposal)
+    def _identify_remaining_concerns(self, scores: Scores) -> List[str]:
+        """評価スコアから未解決の懸念事項を特定"""
+        return [
+            label for i, threshold, label in _CONCERN_RULES if scores[i] < threshold
+        ]
 
-        # 各評価基準のスコアに基づいて懸念事項を特定
-        if scores[EvaluationCriteria.COST.value] < 0.6:
-            concerns.append("コストが高い")
-        if scores[EvaluationCriteria.RISK.value] < 0.6:
-            concerns.append("リスクが高い")
-        if scores[EvaluationCriteria.FEASIBILITY.value] < 0.6:
-            concerns.append("実現可能性に不安がある")
-        if scores[EvaluationCriteria.SUPPORT.value] < 0.6:
-            concerns.append("サポート体制が不十分")
-        if scores[EvaluationCriteria.TRACK_RECORD.value] < 0.6:
-            concerns.append("実績が不十分")
-
-        return concerns
-
-    def _check_decision_criteria(self, proposal: Proposal) -> Dict[str, bool]:
-        """判断基準の充足状況を確認"""
-        scores = self._calculate_evaluation_scores(proposal)
-        return {
-            criteria.value: scores.get(criteria.value, 0.0) >= 0.7
-            for criteria in EvaluationCriteria
-        }
+    def _check_decision_criteria(self, scores: Scores) -> int:
+        """評価スコアから判断基準の充足状況を確認（スコアの添字をビット位置とするビットマスク）"""
+        criteria_met = 0
+        for i, score in enumerate(scores):
+            if score >= 0.7:
+                criteria_met |= 1 << i
+        return criteria_met
 
     def _is_ready_for_decision(
         self,
-        scores: Dict[str, float],
+        scores: Scores,
         concerns: List[str],
-        criteria_met: Dict[str, bool],
+        criteria_met: int,
     ) -> bool:
-        """判断可能な状態かを確認"""
-        essential_criteria = [
-            EvaluationCriteria.COST.value,
-            EvaluationCriteria.RISK.value,
-            EvaluationCriteria.BENEFIT.value,
-        ]
-
-        # 重要な判断基準が満たされているか確認
-        if not all(
-            criteria_met.get(criteria, False) for criteria in essential_criteria
-        ):
-            return False
-
+        """判断可能な状態かを確認（安価な確認から順に行う）"""
         # 重大な懸念事項が残っていないか確認
         if len(concerns) > 2:
             return False
 
-        # 十分な情報が得られているか確認
-        if min(scores.values()) < 0.4:
+        # 重要な判断基準（コスト・リスク・ベネフィット）が満たされているか確認
+        if criteria_met & _ESSENTIAL_CRITERIA_MASK != _ESSENTIAL_CRITERIA_MASK:
             return False
 
-        return True
+        # 十分な情報が得られているか確認
+        return min(scores) >= 0.4
 
     def _make_final_decision(
         self,
-        scores: Dict[str, float],
+        scores: Scores,
         concerns: List[str],
-        criteria_met: Dict[str, bool],
+        criteria_met: int,
     ) -> str:
         """最終判断を行う"""
         # 平均スコアの計算
-        avg_score = sum(scores.values()) / len(scores)
+        avg_score = sum(scores) / len(scores)
 
         # 判断基準の充足率
-        criteria_met_ratio = sum(1 for met in criteria_met.values() if met) / len(
-            criteria_met
-        )
+        criteria_met_ratio = criteria_met.bit_count() / len(_ALL_CRITERIA)
 
         # 懸念事項の重要度評価
         concern_weight = len(concerns) * 0.1
@@ -361,9 +355,9 @@ class ProposalEvaluator:
         final_score = avg_score * (1 - concern_weight) * criteria_met_ratio
 
         # 性格特性による調整
-        if "cautious" in self.personality_traits:
+        if "cautious" in self._traits:
             final_score *= 0.9
-        if "cooperative" in self.personality_traits:
+        if "cooperative" in self._traits:
             final_score *= 1.1
 
         # 判断
@@ -411,5 +405,5 @@ class ProposalEvaluator:
             annual_sales=company_persona.annual_sales,
             industry=company_persona.industry,
             personality_traits=company_persona.personality_traits,
-            interest_products=company_persona.interest_products,
+            interest_products=company_persona.interest_products_by_value,
         )
@@ -1,14 +1,197 @@
+import asyncio
 import json
 import os
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, cast
+import threading
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Coroutine,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from openai import OpenAI, OpenAIError
+from openai import (
+    AsyncOpenAI,
+    BadRequestError,
+    ContentFilterFinishReasonError,
+    LengthFinishReasonError,
+    OpenAI,
+    OpenAIError,
+)
 from pydantic import BaseModel, ValidationError
 
 from src.exceptions import APIError, ConfigurationError
 from src.models.settings import SimulationConfig
 
+__all__ = ["OpenAIClient", "run_sync"]
+
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+# クライアントごとに保持する構造化出力の応答数
+_RESPONSE_CACHE_SIZE = 512
+
+
+def _extract_text(response: Any) -> str:
+    """応答の本文を取り出す（本文がない応答は空文字列）
+
+    str.stripは前後に空白がなければ同じ文字列をそのまま返すため、無条件に呼んでよい。
+    """
+    content = response.choices[0].message.content
+    return "" if content is None else content.strip()
+
+
+def _minify_schema(schema: Any) -> Any:
+    """JSONスキーマからtitleキーワードを再帰的に取り除く
+
+    titleはフィールド名・クラス名の繰り返しで、出力の制約には関係しない。
+    説明（description）は出力内容の指示になるため残す。
+    """
+    if isinstance(schema, list):
+        return [_minify_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    minified = {}
+    for key, value in schema.items():
+        if key == "title":
+            continue
+        if key in ("properties", "$defs"):
+            # プロパティ名・定義名自体は残し、それぞれのスキーマだけを処理する
+            minified[key] = {name: _minify_schema(sub) for name, sub in value.items()}
+        else:
+            minified[key] = _minify_schema(value)
+    return minified
+
+
+@lru_cache(maxsize=64)
+def _schema_prompt_for(model_cls: Type[BaseModel]) -> str:
+    """JSONモードで使う、モデルのJSONスキーマを含むシステムプロンプトを作成"""
+    # インデントや区切りの空白はトークンを消費するだけなので詰めて出力する
+    json_schema = json.dumps(
+        _minify_schema(model_cls.model_json_schema()),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return (
+        "以下のJSONスキーマに準拠したJSONオブジェクトのみを返してください（説明文は不要）。\n"
+        f"スキーマ:{json_schema}"
+    )
+
+
+def _strict_compatible(schema: Any) -> bool:
+    """JSONスキーマが構造化出力のstrictモードで使えるかを判定
+
+    strictモードでは全てのオブジェクトにプロパティを明示し、追加のプロパティを禁止する必要がある。
+    辞書型のフィールドなど、任意のキーを持つオブジェクトを含むスキーマはサーバー側で拒否される。
+    """
+    if isinstance(schema, list):
+        return all(_strict_compatible(item) for item in schema)
+    if not isinstance(schema, dict):
+        return True
+    if schema.get("type") == "object" and (
+        "properties" not in schema
+        or schema.get("additionalProperties", False) is not False
+    ):
+        return False
+    return all(_strict_compatible(value) for value in schema.values())
+
+
+@lru_cache(maxsize=64)
+def _supports_native_structured_output(model_cls: Type[BaseModel]) -> bool:
+    """モデルのスキーマで構造化出力（strictモード）を使えるかを判定"""
+    return _strict_compatible(model_cls.model_json_schema())
+
+
+def _is_schema_rejection(error: BadRequestError) -> bool:
+    """400エラーが応答形式（スキーマ）の拒否によるものかを判定
+
+    コンテキスト長超過やパラメータの誤りなど、他の400エラーはスキーマと無関係なため区別する。
+    """
+    return error.param == "response_format" or error.code == "invalid_json_schema"
+
+
+def _json_mode_messages(
+    messages: List[Dict[str, str]], response_model: Type[BaseModel]
+) -> List[Dict[str, str]]:
+    """JSONモード用に、スキーマを含むシステムプロンプトを加えたメッセージを作成
+
+    呼び出し元のメッセージを書き換えないよう、システムメッセージは複製して更新する。
+    """
+    schema_prompt = _schema_prompt_for(response_model)
+    formatted_messages = list(messages)
+    for i, msg in enumerate(formatted_messages):
+        if msg["role"] == "system":
+            formatted_messages[i] = {
+                **msg,
+                "content": f"{msg['content']}\n\n{schema_prompt}",
+            }
+            break
+    else:
+        formatted_messages.insert(0, {"role": "system", "content": schema_prompt})
+    return formatted_messages
+
+
+@lru_cache(maxsize=None)
+def _shared_client(api_key: str) -> OpenAI:
+    """APIキーごとに共有する同期クライアント（接続プールをインスタンス間で使い回す）"""
+    return OpenAI(api_key=api_key)
+
+
+# イベントループごと・APIキーごとに共有する非同期クライアント
+# （非同期クライアントの接続は作成したイベントループに紐づくため、ループ単位で共有する）
+_async_clients: "weakref.WeakKeyDictionary[Any, Dict[str, AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_async_client(api_key: str) -> AsyncOpenAI:
+    """実行中のイベントループで共有する非同期クライアントを取得"""
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_key)
+    if client is None:
+        client = clients[api_key] = AsyncOpenAI(api_key=api_key)
+    return client
+
+
+async def _close_async_clients() -> None:
+    """実行中のイベントループで共有している非同期クライアントを閉じる"""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+def run_sync(coro: Coroutine[Any, Any, R]) -> R:
+    """コルーチンを新しいイベントループで同期的に実行する
+
+    イベントループが既に動いている場合（Jupyterなど）はasyncio.runを呼べないため、
+    ワーカースレッドで実行する。ループで作った非同期クライアントは終了前に閉じる。
+    """
+
+    async def main() -> R:
+        try:
+            return await coro
+        finally:
+            await _close_async_clients()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(main())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, main()).result()
 
 
 class OpenAIClient:
@@ -20,10 +203,43 @@ class OpenAIClient:
                 "OPENAI_API_KEY environment variable is not set. "
                 "Please set your OpenAI API key in the environment variables."
             )
+        self._api_key = api_key
         try:
-            self.client = OpenAI(api_key=api_key)
+            self.client = _shared_client(api_key)
         except Exception as e:
             raise ConfigurationError(f"Failed to initialize OpenAI client: {str(e)}")
+        # 構造化出力（json_schema）のスキーマを受け付けられなかったモデル
+        self._json_mode_models: Set[type] = set()
+        # 決定的な呼び出しの応答キャッシュ（LRU）
+        self._response_cache: "OrderedDict[Tuple[Any, ...], Union[str, BaseModel]]" = (
+            OrderedDict()
+        )
+        # 複数のスレッドから同じクライアントを使う場合のキャッシュ更新の排他制御
+        self._response_cache_lock = threading.Lock()
+        # 送信中のAPIリクエスト数の上限（スレッド・イベントループをまたいでクライアント全体で共有）
+        self._request_slots = threading.BoundedSemaphore(config.max_concurrent_requests)
+
+    def _temperature(self, temperature: Optional[float]) -> float:
+        """温度パラメータを決定（明示的な0.0も指定値として扱う）"""
+        return self.config.temperature if temperature is None else temperature
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """実行中のイベントループで共有する非同期クライアント（コルーチン内で参照すること）"""
+        return _shared_async_client(self._api_key)
+
+    @asynccontextmanager
+    async def _arequest_slot(self) -> AsyncIterator[None]:
+        """非同期の呼び出しでリクエスト数の上限の枠を確保する
+
+        枠はスレッドと共有するため、イベントループを止めないよう空くまで待機を繰り返す。
+        """
+        while not self._request_slots.acquire(blocking=False):
+            await asyncio.sleep(0.01)
+        try:
+            yield
+        finally:
+            self._request_slots.release()
 
     def call_chat_api(
         self,
@@ -31,6 +247,7 @@ class OpenAIClient:
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        cacheable: Optional[bool] = None,
     ) -> str:
         """
         OpenAI Chat APIを呼び出す
@@ -40,6 +257,7 @@ class OpenAIClient:
             model: 使用するモデル（デフォルトは設定値）
             temperature: 温度パラメータ（デフォルトは設定値）
             max_tokens: 最大トークン数（デフォルトは設定値）
+            cacheable: 応答をキャッシュするか（デフォルトは温度が0の場合のみ）
 
         Returns:
             APIからの応答テキスト
@@ -47,14 +265,21 @@ class OpenAIClient:
         Raises:
             APIError: API呼び出しに失敗した場合
         """
+        model, temperature, max_tokens, cache_key = self._call_options(
+            messages, str, model, temperature, max_tokens, cacheable
+        )
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
         try:
-            response = self.client.chat.completions.create(
-                model=model or self.config.model,
-                messages=messages,
-                temperature=temperature or self.config.temperature,
-                max_tokens=max_tokens or self.config.max_tokens,
-            )
-            return response.choices[0].message.content.strip()
+            with self._request_slots:
+                response = self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            content = _extract_text(response)
         except OpenAIError as e:
             error_message = f"OpenAI API call failed: {str(e)}"
             print(error_message)
@@ -63,6 +288,162 @@ class OpenAIClient:
             error_message = f"Unexpected error during API call: {str(e)}"
             print(error_message)
             raise APIError(error_message) from e
+        self._store_response(cache_key, content)
+        return content
+
+    async def acall_chat_api(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        cacheable: Optional[bool] = None,
+    ) -> str:
+        """
+        OpenAI Chat APIを非同期に呼び出す（引数・戻り値・例外はcall_chat_apiと同じ）
+        """
+        model, temperature, max_tokens, cache_key = self._call_options(
+            messages, str, model, temperature, max_tokens, cacheable
+        )
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+        try:
+            async with self._arequest_slot():
+                response = await self.async_client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            content = _extract_text(response)
+        except OpenAIError as e:
+            error_message = f"OpenAI API call failed: {str(e)}"
+            print(error_message)
+            raise APIError(error_message) from e
+        except Exception as e:
+            error_message = f"Unexpected error during API call: {str(e)}"
+            print(error_message)
+            raise APIError(error_message) from e
+        self._store_response(cache_key, content)
+        return content
+
+    async def acall_chat_api_batch(
+        self,
+        batch: List[List[Dict[str, str]]],
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        複数のメッセージリストに対するChat API呼び出しを並行して実行する
+
+        同時に送信するリクエスト数はクライアント全体の上限（max_concurrent_requests）に従う。
+
+        Args:
+            batch: 呼び出しごとのメッセージのリスト
+            return_exceptions: 失敗した呼び出しの例外を送出せず、結果として返すか
+            **kwargs: acall_chat_apiに渡す追加の引数（model, temperature, max_tokens）
+
+        Returns:
+            batchと同じ順序に並んだ応答テキスト（return_exceptionsの場合は例外を含む）のリスト
+
+        Raises:
+            APIError: いずれかのAPI呼び出しに失敗した場合（return_exceptionsでない場合）
+        """
+        return list(
+            await asyncio.gather(
+                *(self.acall_chat_api(m, **kwargs) for m in batch),
+                return_exceptions=return_exceptions,
+            )
+        )
+
+    def call_chat_api_batch(
+        self,
+        batch: List[List[Dict[str, str]]],
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        複数のメッセージリストに対するChat API呼び出しを並行して実行する（acall_chat_api_batchの同期版）
+
+        呼び出しごとにイベントループと非同期クライアントを作ると接続を使い回せないため、
+        共有の同期クライアントをスレッドから呼び出し、接続プールを全呼び出しで共有する。
+        """
+
+        def call(messages: List[Dict[str, str]]) -> Any:
+            try:
+                return self.call_chat_api(messages, **kwargs)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        if len(batch) <= 1:
+            return [call(messages) for messages in batch]
+        # 同時に送信するリクエスト数はcall_chat_apiがクライアント全体の上限で制限する
+        with ThreadPoolExecutor(max_workers=len(batch)) as executor:
+            return list(executor.map(call, batch))
+
+    def _call_options(
+        self,
+        messages: List[Dict[str, str]],
+        response_type: type,
+        model: Optional[str],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        cacheable: Optional[bool],
+    ) -> Tuple[str, float, int, Optional[Tuple[Any, ...]]]:
+        """呼び出しのモデル・温度・最大トークン数と、応答キャッシュのキーを決定
+
+        キャッシュしない呼び出しのキーはNoneとする。
+        """
+        model = model or self.config.model
+        temperature = self._temperature(temperature)
+        max_tokens = max_tokens or self.config.max_tokens
+        if not self.config.cache_enabled:
+            return model, temperature, max_tokens, None
+        if cacheable is None:
+            # 温度が0より大きい呼び出しは応答が毎回異なることを期待しているため、既定ではキャッシュしない
+            cacheable = temperature == 0
+        cache_key = (
+            (
+                response_type,
+                model,
+                temperature,
+                max_tokens,
+                tuple(tuple(msg.items()) for msg in messages),
+            )
+            if cacheable
+            else None
+        )
+        return model, temperature, max_tokens, cache_key
+
+    def _cached_response(self, cache_key: Optional[Tuple[Any, ...]]) -> Any:
+        """キャッシュした応答を取得（キャッシュにない場合はNone）"""
+        if cache_key is None:
+            return None
+        with self._response_cache_lock:
+            cached = self._response_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._response_cache.move_to_end(cache_key)
+        # 呼び出し元が変更してもキャッシュに影響しないようモデルは複製を返す
+        if isinstance(cached, BaseModel):
+            return cached.model_copy(deep=True)
+        return cached
+
+    def _store_response(
+        self, cache_key: Optional[Tuple[Any, ...]], response: Union[str, BaseModel]
+    ) -> None:
+        """応答をキャッシュに保存（モデルは複製を保存）"""
+        if cache_key is None:
+            return
+        if isinstance(response, BaseModel):
+            response = response.model_copy(deep=True)
+        with self._response_cache_lock:
+            self._response_cache[cache_key] = response
+            if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
 
     def call_structured_api(
         self,
@@ -72,10 +453,13 @@ class OpenAIClient:
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
         max_retries: int = 2,
+        cacheable: Optional[bool] = None,
     ) -> T:
         """
         構造化された応答を返すOpenAI Chat APIを呼び出す
 
+        同じ条件の呼び出しの応答はキャッシュし、APIを呼び出さずに複製を返す。
+
         Args:
             messages: メッセージのリスト
             response_model: 応答を解析するためのPydanticモデル
@@ -83,6 +467,7 @@ class OpenAIClient:
             temperature: 温度パラメータ（デフォルトは設定値）
             max_tokens: 最大トークン数（デフォルトは設定値）
             max_retries: 解析エラー時の最大リトライ回数
+            cacheable: 応答をキャッシュするか（デフォルトは温度が0の場合のみ）
 
         Returns:
             Pydanticモデルに解析された応答
@@ -90,6 +475,68 @@ class OpenAIClient:
         Raises:
             ValueError: 最大リトライ回数試行しても解析に失敗した場合
         """
+        model, temperature, max_tokens, cache_key = self._call_options(
+            messages, response_model, model, temperature, max_tokens, cacheable
+        )
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cast(T, cached)
+
+        parsed = self._call_structured_api_uncached(
+            messages, response_model, model, temperature, max_tokens, max_retries
+        )
+        self._store_response(cache_key, parsed)
+        return parsed
+
+    async def acall_structured_api(
+        self,
+        messages: List[Dict[str, str]],
+        response_model: Type[T],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        max_retries: int = 2,
+        cacheable: Optional[bool] = None,
+    ) -> T:
+        """
+        構造化された応答を返すOpenAI Chat APIを非同期に呼び出す（引数・戻り値・例外はcall_structured_apiと同じ）
+        """
+        model, temperature, max_tokens, cache_key = self._call_options(
+            messages, response_model, model, temperature, max_tokens, cacheable
+        )
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cast(T, cached)
+
+        parsed = await self._acall_structured_api_uncached(
+            messages, response_model, model, temperature, max_tokens, max_retries
+        )
+        self._store_response(cache_key, parsed)
+        return parsed
+
+    def _call_structured_api_uncached(
+        self,
+        messages: List[Dict[str, str]],
+        response_model: Type[T],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        max_retries: int,
+    ) -> T:
+        """キャッシュを介さずに構造化出力のAPIを呼び出す"""
+        # ネイティブの構造化出力を優先し、使えない場合は従来のJSONモードで呼び出す
+        if self._use_native_structured_output(response_model):
+            try:
+                parsed = self._call_native_structured_api(
+                    messages, response_model, model, temperature, max_tokens
+                )
+                if parsed is not None:
+                    return parsed
+                print("Structured output was refused, falling back to JSON mode")
+            except Exception as e:
+                self._handle_native_structured_error(response_model, e)
+
+        formatted_messages = _json_mode_messages(messages, response_model)
         retry_count = 0
         last_error: Optional[Exception] = None
 
@@ -97,46 +544,19 @@ class OpenAIClient:
         while retry_count <= max_retries:
             try:
                 # より低い温度で安定した出力を促進
-                current_temp = (temperature or self.config.temperature) * (
-                    0.7**retry_count
-                )
-
-                # モデルのJSONスキーマを含める
-                json_schema = response_model.model_json_schema()
-                formatted_messages = list(messages)  # メッセージリストをコピー
-
-                # システムプロンプトを強化して構造化出力を促進
-                schema_prompt = f"""
-                あなたは構造化されたJSONを返すAPIです。
-                応答は必ず以下のJSONスキーマに準拠したJSONオブジェクトのみを返してください。
-                余分なテキストや説明は一切含めないでください。
-
-                スキーマ:
-                {json.dumps(json_schema, ensure_ascii=False, indent=2)}
-                """
-
-                # システムメッセージの更新または追加
-                system_message_exists = False
-                for msg in formatted_messages:
-                    if msg["role"] == "system":
-                        msg["content"] = f"{msg['content']}\n\n{schema_prompt}"
-                        system_message_exists = True
-                        break
-                if not system_message_exists:
-                    formatted_messages.insert(
-                        0, {"role": "system", "content": schema_prompt}
-                    )
+                current_temp = temperature * (0.7**retry_count)
 
                 # APIを呼び出す
-                response = self.client.chat.completions.create(
-                    model=model or self.config.model,
-                    messages=formatted_messages,
-                    temperature=current_temp,
-                    max_tokens=max_tokens or self.config.max_tokens,
-                    response_format={"type": "json_object"},
-                )
+                with self._request_slots:
+                    response = self.client.chat.completions.create(
+                        model=model,
+                        messages=formatted_messages,
+                        temperature=current_temp,
+                        max_tokens=max_tokens,
+                        response_format={"type": "json_object"},
+                    )
 
-                content = response.choices[0].message.content.strip()
+                content = _extract_text(response)
 
                 # JSONをパースして検証
                 parsed_data = response_model.model_validate_json(content)
@@ -157,3 +577,120 @@ class OpenAIClient:
         raise ValueError(
             f"Failed to parse structured response after {max_retries + 1} attempts. Last error: {str(last_error)}"
         ) from last_error
+
+    async def _acall_structured_api_uncached(
+        self,
+        messages: List[Dict[str, str]],
+        response_model: Type[T],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        max_retries: int,
+    ) -> T:
+        """キャッシュを介さずに構造化出力のAPIを非同期に呼び出す（_call_structured_api_uncachedの非同期版）"""
+        if self._use_native_structured_output(response_model):
+            try:
+                parsed = await self._acall_native_structured_api(
+                    messages, response_model, model, temperature, max_tokens
+                )
+                if parsed is not None:
+                    return parsed
+                print("Structured output was refused, falling back to JSON mode")
+            except Exception as e:
+                self._handle_native_structured_error(response_model, e)
+
+        formatted_messages = _json_mode_messages(messages, response_model)
+        last_error: Optional[Exception] = None
+
+        for retry_count in range(max_retries + 1):
+            try:
+                async with self._arequest_slot():
+                    response = await self.async_client.chat.completions.create(
+                        model=model,
+                        messages=formatted_messages,
+                        temperature=temperature * (0.7**retry_count),
+                        max_tokens=max_tokens,
+                        response_format={"type": "json_object"},
+                    )
+                return response_model.model_validate_json(_extract_text(response))
+            except (json.JSONDecodeError, ValidationError) as e:
+                last_error = e
+                print(f"Attempt {retry_count + 1} failed to parse response: {e}")
+            except Exception as e:
+                last_error = e
+                print(f"An unexpected error occurred during API call or parsing: {e}")
+                break
+
+        raise ValueError(
+            f"Failed to parse structured response after {max_retries + 1} attempts. Last error: {str(last_error)}"
+        ) from last_error
+
+    def _call_native_structured_api(
+        self,
+        messages: List[Dict[str, str]],
+        response_model: Type[T],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> Optional[T]:
+        """
+        構造化出力（response_formatにPydanticモデルを指定）でAPIを呼び出す
+
+        スキーマはサーバー側で強制されるため、プロンプトにスキーマを含めない。
+
+        Returns:
+            Pydanticモデルに解析された応答（モデルが応答を拒否した場合はNone）
+        """
+        with self._request_slots:
+            completion = self.client.beta.chat.completions.parse(
+                model=model,
+                messages=messages,
+                response_format=response_model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        return completion.choices[0].message.parsed
+
+    async def _acall_native_structured_api(
+        self,
+        messages: List[Dict[str, str]],
+        response_model: Type[T],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> Optional[T]:
+        """構造化出力でAPIを非同期に呼び出す（_call_native_structured_apiの非同期版）"""
+        async with self._arequest_slot():
+            completion = await self.async_client.beta.chat.completions.parse(
+                model=model,
+                messages=messages,
+                response_format=response_model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        return completion.choices[0].message.parsed
+
+    def _use_native_structured_output(self, response_model: Type[BaseModel]) -> bool:
+        """構造化出力で呼び出すか（スキーマが非対応、または拒否されたモデルはJSONモード）"""
+        return response_model not in self._json_mode_models and (
+            _supports_native_structured_output(response_model)
+        )
+
+    def _handle_native_structured_error(
+        self, response_model: Type[BaseModel], error: Exception
+    ) -> None:
+        """構造化出力の失敗を処理（JSONモードで再試行できない例外は送出する）"""
+        if isinstance(error, BadRequestError):
+            if _is_schema_rejection(error):
+                # スキーマが構造化出力に対応していないため、以降もJSONモードを使う
+                self._json_mode_models.add(response_model)
+            print(f"Structured output unavailable, falling back to JSON mode: {error}")
+        elif isinstance(
+            error,
+            (ValidationError, LengthFinishReasonError, ContentFilterFinishReasonError),
+        ):
+            print(f"Structured output failed to parse, retrying in JSON mode: {error}")
+        else:
+            raise ValueError(
+                f"Failed to get structured response: {str(error)}"
+            ) from error
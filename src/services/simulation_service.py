@@ -1,7 +1,8 @@
+import asyncio
 import json
 import random
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
 
 from pydantic import BaseModel, Field, ValidationError
 
@@ -28,7 +29,64 @@ from src.models.persona import (
 )
 from src.models.proposal_analysis import ProposalAnalysis
 from src.models.settings import BankMetadata, Prompts, SimulationConfig
-from src.services.openai_client import OpenAIClient
+from src.services.openai_client import OpenAIClient, run_sync
+
+
+# API呼び出しに失敗した場合に使うデフォルトのメール本文
+_DEFAULT_INITIAL_EMAIL_BODY = """
+{contact_name}
+
+{bank_name} {branch}の{sales_name}でございます。
+
+この度は、お客様の事業についてお話をさせていただく機会をいただき、誠にありがとうございます。
+弊行では、お客様の事業発展のお手伝いができればと考えております。
+
+お客様のご要望やご不明な点などございましたら、お気軽にご相談いただけますと幸いです。
+
+今後ともよろしくお願い申し上げます。
+
+{sales_name}
+{bank_name} {branch}
+"""
+_DEFAULT_FOLLOWUP_EMAIL_BODY = """
+{contact_name}
+
+{bank_name} {branch}の{sales_name}でございます。
+
+前回のご連絡に引き続き、お客様のニーズに合わせた提案をさせていただければと存じます。
+
+ご多忙のところ恐縮ではございますが、ご検討いただけますと幸いです。
+
+今後ともよろしくお願い申し上げます。
+
+{sales_name}
+{bank_name} {branch}
+"""
+_DEFAULT_CUSTOMER_EMAIL_BODY = """
+{sales_name}様
+
+お世話になっております。
+{company_name}の{contact_name}でございます。
+
+ご提案ありがとうございます。
+内容を確認させていただき、検討させていただきます。
+
+何かございましたら、改めてご連絡させていただきます。
+
+よろしくお願いいたします。
+
+{contact_name}
+{company_name}
+"""
+
+
+def _parse_bullet_items(response: str) -> List[str]:
+    """箇条書きの応答を行ごとに分割し、先頭の記号を削除"""
+    return [
+        line.strip().lstrip("・-*").strip()
+        for line in response.split("\n")
+        if line.strip() and any(c.isalnum() for c in line)
+    ]
 
 
 class SimulationService:
@@ -47,8 +105,13 @@ class SimulationService:
     def generate_personas(
         self, prompt: str, persona_type: str
     ) -> List[Union[SalesPersona, CompanyPersona]]:
-        """ペルソナを生成する"""
-        personas = []
+        """ペルソナを生成する（agenerate_personasを同期的に実行する）"""
+        return run_sync(self.agenerate_personas(prompt, persona_type))
+
+    async def agenerate_personas(
+        self, prompt: str, persona_type: str
+    ) -> List[Union[SalesPersona, CompanyPersona]]:
+        """ペルソナを生成する（各ペルソナの生成を並行して実行）"""
         PersonaModel: Type[Union[SalesPersona, CompanyPersona]] = (
             SalesPersona if persona_type == "sales" else CompanyPersona
         )
@@ -62,8 +125,11 @@ class SimulationService:
         余分なテキストや説明は一切含めないでください。
         `annual_sales` は必ず「XX億円」のような文字列形式で出力してください。
         """
+        # 生成は完了順が一定しないため、乱数の種はペルソナ番号順に先に引いておく
+        # （random.seedを設定した実行の再現性を保つ）
+        seeds = [random.getrandbits(64) for _ in range(self.config.num_personas)]
 
-        for i in range(self.config.num_personas):
+        async def generate(i: int) -> Optional[Union[SalesPersona, CompanyPersona]]:
             messages = [
                 {"role": "system", "content": system_prompt},
                 {
@@ -72,28 +138,35 @@ class SimulationService:
                 },
             ]
 
+            # 同時に送信するリクエスト数はOpenAIClientが設定値の上限で制限する
             try:
-                # call_structured_api を使用
-                persona = self.openai_client.call_structured_api(
+                persona = await self.openai_client.acall_structured_api(
                     messages,
                     response_model=PersonaModel,
                     temperature=0.3,  # 低めの温度で安定性を高める
                     max_tokens=3000,
                 )
-                # IDとタイプが未設定の場合に設定 (LLMが省略することがあるため)
-                if not persona.id:
-                    persona.id = f"{persona_type}_{i + 1}"
-                if not persona.type:
-                    persona.type = persona_type
-                personas.append(persona)
-
             except (ValueError, ValidationError) as e:
                 print(f"Error generating/parsing persona {i + 1}: {e}")
                 # エラー発生時はフォールバックとしてデフォルトペルソナを追加（ログ出力のみでも可）
                 # ここではログ出力のみとし、リストには追加しない方針も検討可能
                 print(f"Falling back to default persona for {persona_type} {i + 1}")
-
-        return personas
+                return None
+
+            # IDとタイプが未設定の場合に設定 (LLMが省略することがあるため)
+            if not persona.id:
+                persona.id = f"{persona_type}_{i + 1}"
+            if not persona.type:
+                persona.type = persona_type
+            if isinstance(persona, CompanyPersona):
+                persona.seed_rng(seeds[i])
+            return persona
+
+        # 生成順（ペルソナ番号順）を保ったまま結果をまとめる
+        results = await asyncio.gather(
+            *(generate(i) for i in range(self.config.num_personas))
+        )
+        return [persona for persona in results if persona is not None]
 
     def assign_companies_to_sales(
         self, sales_personas: List[SalesPersona], company_personas: List[CompanyPersona]
@@ -117,6 +190,56 @@ class SimulationService:
             )
         return assignments
 
+    def simulate_assignments(
+        self, assignments: List[Assignment]
+    ) -> List[SimulationResult]:
+        """割り当てたすべての営業担当者と企業の組み合わせをシミュレーション（asimulate_assignmentsを同期的に実行する）"""
+        return run_sync(self.asimulate_assignments(assignments))
+
+    async def asimulate_assignments(
+        self, assignments: List[Assignment]
+    ) -> List[SimulationResult]:
+        """割り当てたすべての営業担当者と企業の組み合わせを並行してシミュレーション
+
+        組み合わせ同士にはデータの依存関係がないため並行して実行する。
+        ただし同じ企業ペルソナはシミュレーション中に状況が更新されるため、
+        同じ企業を含む組み合わせは割り当て順に1つずつ実行する。
+
+        Returns:
+            割り当て順（営業担当者順・担当企業順）に並んだシミュレーション結果
+        """
+        pairs = [
+            (idx, comp_idx, assignment.sales_persona, company_persona)
+            for idx, assignment in enumerate(assignments, 1)
+            for comp_idx, company_persona in enumerate(assignment.assigned_companies, 1)
+        ]
+        # 企業ペルソナごとに、その企業を含む組み合わせの位置をまとめる
+        pairs_by_company: Dict[int, List[int]] = {}
+        for position, (_, _, _, company_persona) in enumerate(pairs):
+            pairs_by_company.setdefault(id(company_persona), []).append(position)
+
+        results: List[Optional[SimulationResult]] = [None] * len(pairs)
+
+        def run_pair(position: int) -> None:
+            _, _, sales_persona, company_persona = pairs[position]
+            results[position] = self.simulate_time_series_visits(
+                sales_persona, company_persona
+            )
+
+        async def run_company(positions: List[int]) -> None:
+            # 各シミュレーションは同期的にAPIを呼び出すため、スレッドで実行する
+            # （同時に送信するリクエスト数はOpenAIClientが設定値の上限で制限する）
+            for position in positions:
+                idx, comp_idx, _, _ = pairs[position]
+                # 見出しは他のスレッドの出力と混ざらないよう、スレッドに渡す前に出力する
+                print(
+                    f"\n=== 営業マン{idx} と 企業ペルソナ【担当企業{comp_idx}】 の時系列訪問シミュレーション ==="
+                )
+                await asyncio.to_thread(run_pair, position)
+
+        await asyncio.gather(*(run_company(p) for p in pairs_by_company.values()))
+        return cast(List[SimulationResult], results)
+
     def simulate_bank_conversation_session(
         self,
         sales_persona: SalesPersona,
@@ -282,13 +405,12 @@ class SimulationService:
             current_status, matched_products, company_persona
         )
 
-        history_dicts = [h.to_dict() for h in session_history]
-
         return SessionSummary(
             session_num=session_num,
             timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             visit_date=current_visit_date.strftime("%Y-%m-%d"),
-            history=history_dicts,
+            # 履歴はdictに変換せずそのまま渡す（SessionSummaryの検証ではそのまま保持される）
+            history=session_history,
             final_status=final_status,
             matched_products=matched_products,
         )
@@ -357,13 +479,10 @@ class SimulationService:
                 email.product_type
             )
 
-        # メール内容から話題を抽出して追加
-        topics = self._extract_topics_from_email(email)
+        # メール内容から話題と約束事項を抽出して追加
+        topics, actions = self._extract_topics_and_actions(email)
         for topic in topics:
             company_persona.conversation_context.add_topic(topic)
-
-        # 約束事項を抽出して追加
-        actions = self._extract_actions_from_email(email)
         for action in actions:
             company_persona.conversation_context.add_action(action)
 
@@ -423,6 +542,19 @@ class SimulationService:
         company_persona: CompanyPersona,
     ) -> MeetingLog:
         """訪問記録を生成する"""
+        messages = self._meeting_log_messages(
+            session_summary, sales_persona, company_persona
+        )
+        content = self.openai_client.call_chat_api(messages, max_tokens=3000)
+        return self._build_meeting_log(session_summary, content)
+
+    def _meeting_log_messages(
+        self,
+        session_summary: SessionSummary,
+        sales_persona: SalesPersona,
+        company_persona: CompanyPersona,
+    ) -> List[Dict[str, str]]:
+        """訪問記録を生成するためのメッセージを作成（企業担当者の現在の状況を反映）"""
         # メールの履歴から訪問内容を抽出
         email_history = []
         for history in session_summary.history:
@@ -440,7 +572,7 @@ class SimulationService:
         - 役職：{company_persona.contact_person.position}
         - 年齢：{company_persona.contact_person.age}
         - 入社年数：{company_persona.contact_person.years_in_company}
-        - 性格特性：{", ".join([t.value for t in company_persona.contact_person.personality_traits])}
+        - 性格特性：{company_persona.contact_person.traits_text}
         - 意思決定スタイル：{company_persona.contact_person.decision_making_style}
         - リスク許容度：{company_persona.contact_person.risk_tolerance}
         - 金融リテラシー：{company_persona.contact_person.financial_literacy}
@@ -452,15 +584,17 @@ class SimulationService:
         {chr(10).join(email_history)}
 
         商品提案の進捗：
-        {", ".join([p.value for p in session_summary.matched_products]) if session_summary.matched_products else "提案中"}
+        {", ".join(session_summary.matched_products) if session_summary.matched_products else "提案中"}
         """
 
-        messages = [
+        return [
             {"role": "system", "content": self.prompts.system_prompt_record_bank},
             {"role": "user", "content": report_prompt},
         ]
 
-        content = self.openai_client.call_chat_api(messages, max_tokens=3000)
+    @staticmethod
+    def _build_meeting_log(session_summary: SessionSummary, content: str) -> MeetingLog:
+        """生成した報告書から訪問記録を作成"""
         return MeetingLog(
             session_num=session_summary.session_num,
             visit_date=session_summary.visit_date,
@@ -474,7 +608,8 @@ class SimulationService:
     ) -> SimulationResult:
         """複数回の訪問セッションをシミュレーション"""
         session_logs = []
-        meeting_logs = []
+        # 訪問記録の生成用メッセージ（後続の訪問は訪問記録に依存しないため、最後にまとめて生成する）
+        meeting_log_batch = []
         prev_summary = None
         progress = SalesProgress()
         current_date = datetime.now()
@@ -491,13 +626,14 @@ class SimulationService:
             company_persona.update_situation(days_passed)
 
             # 前回の訪問内容を準備
+            # （ProductTypeはstrを継承しているため、.valueを取らずにそのまま連結できる）
             if visit > 1:
                 prev_summary = "\n".join(
                     [
                         f"【前回の訪問内容（{visit - 1}回目）】",
                         f"訪問日: {session_logs[-1].visit_date}",
                         f"最終ステータス: {session_logs[-1].final_status}",
-                        f"マッチした商品: {', '.join([p.value for p in session_logs[-1].matched_products])}",
+                        f"マッチした商品: {', '.join(session_logs[-1].matched_products)}",
                         "会話の要約:",
                         *[f"{h.role}: {h.content}" for h in session_logs[-1].history],
                     ]
@@ -513,15 +649,26 @@ class SimulationService:
             )
             session_logs.append(session_summary)
 
-            meeting_log = self.record_bank_meeting_log(
-                session_summary, sales_persona, company_persona
+            # 企業の状況は次の訪問で更新されるため、メッセージはこの時点で作成しておく
+            meeting_log_batch.append(
+                self._meeting_log_messages(
+                    session_summary, sales_persona, company_persona
+                )
             )
-            meeting_logs.append(meeting_log)
 
             # 進捗状況を更新（成功した商品と訪問回数のみ）
             progress.matched_products.extend(session_summary.matched_products)
             progress.current_visit = visit
 
+        # すべての訪問の訪問記録を並行して生成
+        reports = self.openai_client.call_chat_api_batch(
+            meeting_log_batch, max_tokens=3000
+        )
+        meeting_logs = [
+            self._build_meeting_log(summary, content)
+            for summary, content in zip(session_logs, reports)
+        ]
+
         # 最終的なステータスを決定（すべての訪問が終わった後）
         final_status = (
             SalesStatus.SUCCESS
@@ -541,6 +688,39 @@ class SimulationService:
             matched_products=progress.matched_products,
         )
 
+    def _sales_system_message(
+        self, sales_persona: SalesPersona, company_persona: CompanyPersona
+    ) -> Dict[str, str]:
+        """営業担当者側のシステムメッセージ
+
+        訪問中に変わらないペルソナ情報をシステムプロンプトに続けて先頭に置き、
+        APIのプロンプトキャッシュで同じ訪問内の呼び出し間の共通部分を再利用できるようにする。
+        """
+        return {
+            "role": "system",
+            "content": (
+                f"{self.prompts.system_prompt_sales_bank}\n\n"
+                f"{sales_persona.profile_prompt}\n\n"
+                f"{company_persona.company_profile_prompt}\n\n"
+                f"{company_persona.contact_profile_prompt}"
+            ),
+        }
+
+    def _customer_system_message(
+        self, company_persona: CompanyPersona
+    ) -> Dict[str, str]:
+        """企業担当者側のシステムメッセージ（構成は_sales_system_messageと同じ）"""
+        return {
+            "role": "system",
+            "content": (
+                f"{self.prompts.system_prompt_customer_bank}\n\n"
+                f"{company_persona.company_profile_prompt}\n\n"
+                f"{company_persona.contact_profile_prompt}\n"
+                f"- 性格：{company_persona.traits_text}\n"
+                f"- 意思決定スタイル：{company_persona.decision_making_style}"
+            ),
+        }
+
     def _create_initial_greeting_prompt(
         self,
         sales_persona: SalesPersona,
@@ -549,38 +729,22 @@ class SimulationService:
     ) -> str:
         """初回訪問時のプロンプトを作成"""
         return f"""
-        あなたは以下の特性を持つ銀行の営業担当者として、初回のメールを作成してください：
-
-        営業担当者情報：
-        - 名前：{sales_persona.name}
-        - 経験：{sales_persona.experience_level.value}
-        - 性格：{", ".join([trait.value for trait in sales_persona.personality_traits])}
-        - 得意分野：{", ".join(sales_persona.specialties)}
-
-        企業情報：
-        - 企業名：{company_persona.name}
-        - 業種：{company_persona.industry}
-        - 事業内容：{company_persona.business_description}
-        - 資金ニーズ：{company_persona.financial_needs}
-        
-        企業担当者情報：
-        - 名前：{company_persona.contact_person.name if company_persona.contact_person else "不明"}
-        - 役職：{company_persona.contact_person.position if company_persona.contact_person else "不明"}
-
-        以下の点に注意してメールを作成してください：
-        1. 初回訪問であることを意識した内容にする
-        2. 企業の事業内容や資金ニーズに言及する
-        3. 具体的な商品提案は控えめにし、まずは関係構築を重視する
-        4. 企業担当者の性格特性に合わせたトーンで書く
-        5. メールは必ず以下の形式で記載する：
-
-        件名: [ここに件名]
-        送信者: {sales_persona.name}
-        受信者: {company_persona.contact_person.name if company_persona.contact_person else "ご担当者様"}
-        日時: {visit_date.strftime("%Y-%m-%d %H:%M:%S")}
-
-        [ここに本文]
-        """
+上記の営業担当者として、企業担当者への初回のメールを作成してください。
+
+以下の点に注意してメールを作成してください：
+1. 初回訪問であることを意識した内容にする
+2. 企業の事業内容や資金ニーズに言及する
+3. 具体的な商品提案は控えめにし、まずは関係構築を重視する
+4. 企業担当者の性格特性に合わせたトーンで書く
+5. メールは必ず以下の形式で記載する：
+
+件名: [ここに件名]
+送信者: {sales_persona.name}
+受信者: {company_persona.contact_person.name if company_persona.contact_person else "ご担当者様"}
+日時: {visit_date.strftime("%Y-%m-%d %H:%M:%S")}
+
+[ここに本文]
+"""
 
     def _create_followup_greeting_prompt(
         self,
@@ -610,42 +774,31 @@ class SimulationService:
         )
 
         return f"""
-        あなたは以下の特性を持つ銀行の営業担当者として、フォローアップのメールを作成してください：
-
-        営業担当者情報：
-        - 名前：{sales_persona.name}
-        - 経験：{sales_persona.experience_level.value}
-        - 性格：{", ".join([trait.value for trait in sales_persona.personality_traits])}
-        - 得意分野：{", ".join(sales_persona.specialties)}
-
-        企業情報：
-        - 企業名：{company_persona.name}
-        - 業種：{company_persona.industry}
-        - 資金ニーズ：{company_persona.financial_needs}
-        
-        商談状況：
-        - 商談ステージ：{negotiation_stage}
-        - 主な懸念事項：{key_concerns}
-        - 必要な追加情報：{required_info}
-        - 現在の興味度：{company_persona.current_interest_score.score:.1f}
-
-        直近の会話履歴：
-        {recent_history}
-
-        以下の点に注意してメールを作成してください：
-        1. 前回までの会話内容を踏まえた内容にする
-        2. 商談ステージに応じた適切な提案や質問を行う
-        3. 懸念事項や必要な情報に関する確認を含める
-        4. 企業担当者の反応に基づいて提案内容を調整する
-        5. メールは必ず以下の形式で記載する：
-
-        件名: [ここに件名]
-        送信者: {sales_persona.name}
-        受信者: {company_persona.contact_person.name if company_persona.contact_person else "ご担当者様"}
-        日時: {visit_date.strftime("%Y-%m-%d %H:%M:%S")}
-
-        [ここに本文]
-        """
+上記の営業担当者として、企業担当者へのフォローアップのメールを作成してください。
+
+商談状況：
+- 商談ステージ：{negotiation_stage}
+- 主な懸念事項：{key_concerns}
+- 必要な追加情報：{required_info}
+- 現在の興味度：{company_persona.current_interest_score.score:.1f}
+
+直近の会話履歴：
+{recent_history}
+
+以下の点に注意してメールを作成してください：
+1. 前回までの会話内容を踏まえた内容にする
+2. 商談ステージに応じた適切な提案や質問を行う
+3. 懸念事項や必要な情報に関する確認を含める
+4. 企業担当者の反応に基づいて提案内容を調整する
+5. メールは必ず以下の形式で記載する：
+
+件名: [ここに件名]
+送信者: {sales_persona.name}
+受信者: {company_persona.contact_person.name if company_persona.contact_person else "ご担当者様"}
+日時: {visit_date.strftime("%Y-%m-%d %H:%M:%S")}
+
+[ここに本文]
+"""
 
     def _generate_email_message(
         self,
@@ -656,7 +809,7 @@ class SimulationService:
         """プロンプトに基づいてメールメッセージを生成"""
         try:
             messages = [
-                {"role": "system", "content": self.prompts.system_prompt_sales_bank},
+                self._sales_system_message(sales_persona, company_persona),
                 {"role": "user", "content": prompt},
             ]
 
@@ -710,49 +863,31 @@ class SimulationService:
         """デフォルトのメールメッセージを作成"""
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+        contact_name = (
+            company_persona.contact_person.name
+            if company_persona.contact_person
+            else "ご担当者様"
+        )
         if session_num == 1:
             subject = (
                 f"初回のご挨拶 - {sales_persona.name}（{self.bank_metadata.bank_name}）"
             )
-            body = f"""
-{company_persona.contact_person.name if company_persona.contact_person else "ご担当者様"}
-
-{self.bank_metadata.bank_name} {self.bank_metadata.branch}の{sales_persona.name}でございます。
-
-この度は、お客様の事業についてお話をさせていただく機会をいただき、誠にありがとうございます。
-弊行では、お客様の事業発展のお手伝いができればと考えております。
-
-お客様のご要望やご不明な点などございましたら、お気軽にご相談いただけますと幸いです。
-
-今後ともよろしくお願い申し上げます。
-
-{sales_persona.name}
-{self.bank_metadata.bank_name} {self.bank_metadata.branch}
-"""
+            body_template = _DEFAULT_INITIAL_EMAIL_BODY
         else:
             subject = f"ご提案のご相談 - {sales_persona.name}（{self.bank_metadata.bank_name}）"
-            body = f"""
-{company_persona.contact_person.name if company_persona.contact_person else "ご担当者様"}
-
-{self.bank_metadata.bank_name} {self.bank_metadata.branch}の{sales_persona.name}でございます。
-
-前回のご連絡に引き続き、お客様のニーズに合わせた提案をさせていただければと存じます。
-
-ご多忙のところ恐縮ではございますが、ご検討いただけますと幸いです。
-
-今後ともよろしくお願い申し上げます。
-
-{sales_persona.name}
-{self.bank_metadata.bank_name} {self.bank_metadata.branch}
-"""
+            body_template = _DEFAULT_FOLLOWUP_EMAIL_BODY
+        body = body_template.format(
+            contact_name=contact_name,
+            bank_name=self.bank_metadata.bank_name,
+            branch=self.bank_metadata.branch,
+            sales_name=sales_persona.name,
+        )
 
         return EmailMessage(
             subject=subject,
             body=body,
             sender=sales_persona.name,
-            recipient=company_persona.contact_person.name
-            if company_persona.contact_person
-            else "ご担当者様",
+            recipient=contact_name,
             date=current_time,
         )
 
@@ -775,18 +910,6 @@ class SimulationService:
             )
 
             prompt = f"""
-企業情報：
-- 企業名：{company_persona.name}
-- 業種：{company_persona.industry}
-- 事業内容：{company_persona.business_description}
-- 資金ニーズ：{company_persona.financial_needs}
-
-企業担当者情報：
-- 名前：{company_persona.contact_person.name if company_persona.contact_person else "不明"}
-- 役職：{company_persona.contact_person.position if company_persona.contact_person else "不明"}
-- 性格：{", ".join([trait.value for trait in company_persona.personality_traits])}
-- 意思決定スタイル：{company_persona.decision_making_style}
-
 直近の会話履歴：
 {recent_history}
 
@@ -805,7 +928,7 @@ class SimulationService:
 """
 
             messages = [
-                {"role": "system", "content": self.prompts.system_prompt_customer_bank},
+                self._customer_system_message(company_persona),
                 {"role": "user", "content": prompt},
             ]
 
@@ -858,30 +981,21 @@ class SimulationService:
         """デフォルトの企業担当者からのメールを作成"""
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        subject = f"Re: ご提案について"
-        body = f"""
-{sales_persona.name}様
-
-お世話になっております。
-{company_persona.name}の{company_persona.contact_person.name if company_persona.contact_person else "担当者"}でございます。
-
-ご提案ありがとうございます。
-内容を確認させていただき、検討させていただきます。
-
-何かございましたら、改めてご連絡させていただきます。
-
-よろしくお願いいたします。
-
-{company_persona.contact_person.name if company_persona.contact_person else "担当者"}
-{company_persona.name}
-"""
+        contact_name = (
+            company_persona.contact_person.name
+            if company_persona.contact_person
+            else "担当者"
+        )
+        body = _DEFAULT_CUSTOMER_EMAIL_BODY.format(
+            sales_name=sales_persona.name,
+            company_name=company_persona.name,
+            contact_name=contact_name,
+        )
 
         return EmailMessage(
-            subject=subject,
+            subject="Re: ご提案について",
             body=body,
-            sender=company_persona.contact_person.name
-            if company_persona.contact_person
-            else "担当者",
+            sender=contact_name,
             recipient=sales_persona.name,
             date=current_time,
         )
@@ -905,17 +1019,6 @@ class SimulationService:
             )
 
             prompt = f"""
-営業担当者情報：
-- 名前：{sales_persona.name}
-- 経験：{sales_persona.experience_level.value}
-- 性格：{", ".join([trait.value for trait in sales_persona.personality_traits])}
-- 得意分野：{", ".join(sales_persona.specialties)}
-
-企業情報：
-- 企業名：{company_persona.name}
-- 業種：{company_persona.industry}
-- 資金ニーズ：{company_persona.financial_needs}
-
 直近の会話履歴：
 {recent_history}
 
@@ -934,7 +1037,7 @@ class SimulationService:
 """
 
             messages = [
-                {"role": "system", "content": self.prompts.system_prompt_sales_bank},
+                self._sales_system_message(sales_persona, company_persona),
                 {"role": "user", "content": prompt},
             ]
 
@@ -979,46 +1082,18 @@ class SimulationService:
             print(f"Error generating sales email: {e}")
             return self._create_default_email(sales_persona, company_persona)
 
-    def _extract_topics_from_email(self, email: EmailMessage) -> List[str]:
-        """メール内容から話題を抽出"""
-        try:
-            prompt = f"""
+    def _extract_topics_and_actions(
+        self, email: EmailMessage
+    ) -> Tuple[List[str], List[str]]:
+        """メール内容から話題と約束事項を抽出（2つの抽出は互いに独立しているため並行して実行し、失敗も個別に扱う）"""
+        topic_prompt = f"""
             以下のメール内容から主要な話題を抽出してください。
             箇条書きで3つまで抽出してください。
 
             メール内容：
             {email.body}
             """
-
-            messages = [
-                {
-                    "role": "system",
-                    "content": "あなたはメール内容から主要な話題を抽出する専門家です。",
-                },
-                {"role": "user", "content": prompt},
-            ]
-
-            response = self.openai_client.call_chat_api(
-                messages, temperature=0.3, max_tokens=200
-            )
-
-            # 箇条書きの応答を行ごとに分割し、先頭の記号を削除
-            topics = [
-                line.strip().lstrip("・-*").strip()
-                for line in response.split("\n")
-                if line.strip() and any(c.isalnum() for c in line)
-            ]
-
-            return topics[:3]  # 最大3つまでの話題を返す
-
-        except Exception as e:
-            print(f"Error extracting topics from email: {e}")
-            return []
-
-    def _extract_actions_from_email(self, email: EmailMessage) -> List[str]:
-        """メール内容から約束事項を抽出"""
-        try:
-            prompt = f"""
+        action_prompt = f"""
             以下のメール内容から約束事項や次のアクションを抽出してください。
             箇条書きで3つまで抽出してください。
             期限や具体的な行動が含まれているものを優先してください。
@@ -1026,28 +1101,36 @@ class SimulationService:
             メール内容：
             {email.body}
             """
-
-            messages = [
+        batch = [
+            [
+                {
+                    "role": "system",
+                    "content": "あなたはメール内容から主要な話題を抽出する専門家です。",
+                },
+                {"role": "user", "content": topic_prompt},
+            ],
+            [
                 {
                     "role": "system",
                     "content": "あなたはメール内容から約束事項やアクションアイテムを抽出する専門家です。",
                 },
-                {"role": "user", "content": prompt},
-            ]
-
-            response = self.openai_client.call_chat_api(
-                messages, temperature=0.3, max_tokens=200
-            )
-
-            # 箇条書きの応答を行ごとに分割し、先頭の記号を削除
-            actions = [
-                line.strip().lstrip("・-*").strip()
-                for line in response.split("\n")
-                if line.strip() and any(c.isalnum() for c in line)
-            ]
-
-            return actions[:3]  # 最大3つまでのアクションを返す
+                {"role": "user", "content": action_prompt},
+            ],
+        ]
 
-        except Exception as e:
-            print(f"Error extracting actions from email: {e}")
-            return []
+        # 一方の抽出が失敗しても、もう一方の結果は使う
+        topics_response, actions_response = self.openai_client.call_chat_api_batch(
+            batch, temperature=0.3, max_tokens=200, return_exceptions=True
+        )
+        topics: List[str] = []
+        actions: List[str] = []
+        # 最大3つまでの話題・アクションを返す
+        if isinstance(topics_response, Exception):
+            print(f"Error extracting topics from email: {topics_response}")
+        else:
+            topics = _parse_bullet_items(topics_response)[:3]
+        if isinstance(actions_response, Exception):
+            print(f"Error extracting actions from email: {actions_response}")
+        else:
+            actions = _parse_bullet_items(actions_response)[:3]
+        return topics, actions